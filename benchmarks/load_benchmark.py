@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Load Benchmark - sustained SayHello load, optionally across a rolling restart
+Starts the Hello service as a separate process and drives it from concurrent
+client threads over one shared channel. The channel load-balances across two
+addresses with client-side health checking, the way a client sees instances
+behind a service during a rolling deploy.
+
+With --restart, a replacement process starts on the second address halfway
+through and the original is then sent SIGTERM. The original reports
+NOT_SERVING, waits DRAIN_DELAY for the client to move away, then drains, so
+the run shows whether the restart loses any requests.
+
+With --faults, the given fault-injection rules (JSON, see FaultRule in
+proto/admin.proto) are set on every server through AdminService.SetFaults
+before load starts, to measure tail latency and goodput under partial failure.
+
+Usage:
+  python benchmarks/load_benchmark.py [--seconds 10] [--concurrency 16] [--timeout 5] [--restart]
+      [--faults '[{"percentage": 10, "error_code": 14}, {"percentage": 5, "latency_ms": 200}]']
+"""
+import argparse
+import collections
+import grpc
+import json
+import signal
+import socket
+import subprocess
+import sys
+import os
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from google.protobuf import json_format
+from grpc_stubs import admin_pb2, admin_pb2_grpc, service_pb2, service_pb2_grpc
+
+SERVER_SCRIPT = os.path.join(ROOT, 'service_b', 'server.py')
+
+# round_robin over every address, skipping instances whose grpc.health.v1
+# status is not SERVING; reconnect quickly once a replacement comes up
+CHANNEL_OPTIONS = [
+    ('grpc.service_config', json.dumps({
+        'loadBalancingConfig': [{'round_robin': {}}],
+        'healthCheckConfig': {'serviceName': ''}
+    })),
+    ('grpc.initial_reconnect_backoff_ms', 100),
+    ('grpc.max_reconnect_backoff_ms', 200)
+]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class ServerProcess:
+    """A Hello server subprocess whose start-up and shutdown lines are captured"""
+
+    def __init__(self, label, env, port):
+        self.label = label
+        self.address = f"127.0.0.1:{port}"
+        env = dict(env, HELLO_GRPC_LISTEN=self.address)
+        self.started = threading.Event()
+        self.lifecycle = []
+        self.process = subprocess.Popen(
+            [sys.executable, SERVER_SCRIPT],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True
+        )
+        threading.Thread(target=self._read_output, daemon=True).start()
+
+    def _read_output(self):
+        for line in self.process.stdout:
+            if "server started" in line.lower():
+                self.started.set()
+            if "Received request" not in line and line.strip():
+                self.lifecycle.append(line.rstrip())
+
+    def set_faults(self, faults):
+        with grpc.insecure_channel(self.address) as channel:
+            admin_pb2_grpc.AdminServiceStub(channel).SetFaults(faults, timeout=5)
+
+    def terminate(self):
+        self.process.send_signal(signal.SIGTERM)
+
+    def wait(self):
+        return self.process.wait()
+
+
+def run_load(target, seconds, concurrency, timeout, on_start=None):
+    """Issue SayHello calls for `seconds`; return (latency, status code) per call"""
+    calls = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    with grpc.insecure_channel(target, options=CHANNEL_OPTIONS) as channel:
+        stub = service_pb2_grpc.HelloServiceStub(channel)
+
+        def worker():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    stub.SayHello(service_pb2.HelloRequest(name="load"), timeout=timeout)
+                    code = grpc.StatusCode.OK
+                except grpc.RpcError as e:
+                    code = e.code()
+                elapsed = time.perf_counter() - start
+                with lock:
+                    calls.append((elapsed, code))
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        if on_start is not None:
+            on_start()
+        for thread in threads:
+            thread.join()
+
+    return calls
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] if ordered else 0.0
+
+
+def latency_row(label, latencies):
+    cells = "".join(f"{percentile(latencies, p) * 1000:>10.1f}" for p in (50, 90, 99, 99.9))
+    return f"{label:<14}{len(latencies):>10}{cells}{max(latencies, default=0) * 1000:>10.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=5.0, help="per-call deadline in seconds")
+    parser.add_argument("--restart", action="store_true", help="replace the server halfway through")
+    parser.add_argument("--faults", help="JSON FaultRule or list of rules to inject on the server")
+    args = parser.parse_args()
+
+    faults = None
+    if args.faults:
+        rules = json.loads(args.faults)
+        faults = json_format.ParseDict(
+            {"rules": rules if isinstance(rules, list) else [rules], "replace": True},
+            admin_pb2.SetFaultsRequest()
+        )
+
+    ports = [free_port(), free_port()]
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    env.pop('GRPC_UDS_DIR', None)
+    env.setdefault('GRPC_DRAIN_DELAY', "1")
+    target = "ipv4:" + ",".join(f"127.0.0.1:{port}" for port in ports)
+
+    servers = [ServerProcess("original", env, ports[0])]
+    if not servers[0].started.wait(30):
+        print("❌ Hello server did not start")
+        return
+    if faults is not None:
+        servers[0].set_faults(faults)
+
+    def restart():
+        time.sleep(args.seconds / 2)
+        replacement = ServerProcess("replacement", env, ports[1])
+        servers.append(replacement)
+        replacement.started.wait(30)
+        if faults is not None:
+            replacement.set_faults(faults)
+        # Give the client a moment to connect and health-check the replacement
+        time.sleep(0.5)
+        servers[0].terminate()
+
+    print("🔁 Load Benchmark")
+    print("=" * 60)
+    print(f"Target: {target}, concurrency: {args.concurrency}, duration: {args.seconds:g}s, "
+          f"timeout: {args.timeout:g}s, restart: {'yes' if args.restart else 'no'}")
+    if faults is not None:
+        print(f"Faults: {len(faults.rules)} rule(s) on every server")
+
+    try:
+        start = time.perf_counter()
+        calls = run_load(
+            target, args.seconds, args.concurrency, args.timeout,
+            on_start=threading.Thread(target=restart, daemon=True).start if args.restart else None
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        for server in servers:
+            if server.process.poll() is None:
+                server.terminate()
+        exit_codes = [server.wait() for server in servers]
+
+    statuses = collections.Counter(code for _, code in calls)
+    total = len(calls)
+    succeeded = statuses[grpc.StatusCode.OK]
+    print(f"\nRequests: {total} in {elapsed:.1f}s -> {total / elapsed:,.0f} req/s, "
+          f"goodput {succeeded / elapsed:,.0f} req/s ({succeeded / max(total, 1):.1%} succeeded)")
+    print(f"\n{'latency ms':<14}{'calls':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'p99.9':>10}{'max':>10}")
+    print(latency_row("succeeded", [latency for latency, code in calls if code is grpc.StatusCode.OK]))
+    print(latency_row("all", [latency for latency, _ in calls]))
+    print()
+    for code, count in sorted(statuses.items(), key=lambda item: item[0].value[0]):
+        print(f"  {code.name:<20}{count:>10}")
+
+    errors = total - succeeded
+    print(f"\n{'✅' if errors == 0 else '❌'} {errors} failed requests")
+    for server, code in zip(servers, exit_codes):
+        print(f"\n[{server.label}] exit code {code}")
+        for line in server.lifecycle:
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
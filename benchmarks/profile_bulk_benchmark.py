@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Profile Bulk Benchmark - ImportProfiles / ExportProfiles throughput
+Starts the Profile service in-process (or uses PROFILE_GRPC_TARGET when set),
+streams generated profiles in, exports them back and reports records/second.
+
+Usage:
+  python benchmarks/profile_bulk_benchmark.py [records] [batch_size]
+"""
+import grpc
+import importlib.util
+import sys
+import os
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'service_profile'))
+
+from grpc_common.server import create_server
+from grpc_stubs import profile_pb2, profile_pb2_grpc
+
+COUNTRIES = [("IN", "Bengaluru"), ("IN", "Chennai"), ("US", "New York"), ("GB", "London"), ("DE", "Berlin")]
+
+
+def load_profile_server():
+    spec = importlib.util.spec_from_file_location(
+        "profile_server", os.path.join(ROOT, 'service_profile', 'server.py')
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_batches(records, batch_size, invalid_every=0):
+    """Yield ProfileBatch messages; every `invalid_every`-th record is invalid"""
+    batch = []
+    for i in range(records):
+        country, city = COUNTRIES[i % len(COUNTRIES)]
+        if invalid_every and i % invalid_every == 0:
+            country = "INVALID"
+        batch.append(profile_pb2.ProfileRecord(
+            user_id=f"bulk-user-{i}",
+            name=f"Bulk User {i}",
+            preferred_city=city,
+            preferred_country=country
+        ))
+        if len(batch) == batch_size:
+            yield profile_pb2.ProfileBatch(profiles=batch)
+            batch = []
+    if batch:
+        yield profile_pb2.ProfileBatch(profiles=batch)
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    server = None
+    target = os.environ.get('PROFILE_GRPC_TARGET')
+    if not target:
+        profile_server = load_profile_server()
+        server = create_server('profile')
+        profile_pb2_grpc.add_ProfileServiceServicer_to_server(
+            profile_server.ProfileServicer(profile_server.ProfileStore()), server
+        )
+        target = f"localhost:{server.add_insecure_port('localhost:0')}"
+        server.start()
+
+    print("📦 Profile Bulk Benchmark")
+    print("=" * 60)
+    print(f"Target: {target}, records: {records}, batch size: {batch_size}")
+
+    try:
+        with grpc.insecure_channel(target) as channel:
+            stub = profile_pb2_grpc.ProfileServiceStub(channel)
+
+            start = time.perf_counter()
+            reply = stub.ImportProfiles(generate_batches(records, batch_size, invalid_every=1000))
+            elapsed = time.perf_counter() - start
+            print(f"\n⬆️  Import: {reply.imported} imported, {reply.failed} failed "
+                  f"({len(reply.errors)} reported) in {elapsed:.2f}s "
+                  f"-> {reply.received / elapsed:,.0f} records/s")
+            if reply.errors:
+                first = reply.errors[0]
+                print(f"   First error: #{first.index} {first.user_id}: {first.message}")
+
+            for label, request in (
+                ("all", profile_pb2.ExportProfilesRequest(batch_size=batch_size)),
+                ("country=IN", profile_pb2.ExportProfilesRequest(country="IN", batch_size=batch_size)),
+            ):
+                start = time.perf_counter()
+                exported = sum(len(batch.profiles) for batch in stub.ExportProfiles(request))
+                elapsed = time.perf_counter() - start
+                print(f"⬇️  Export {label}: {exported} records in {elapsed:.2f}s "
+                      f"-> {exported / elapsed:,.0f} records/s")
+    finally:
+        if server is not None:
+            server.stop(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Protobuf Benchmark - serialize / parse / construct for every message
+Covers every message type in grpc_stubs (i.e. every proto/*.proto) with each
+message-building style, and repeats the run in a subprocess per protobuf
+backend (upb, python) so the cost of the pure-Python fallback is visible.
+
+Build styles:
+  serialize  template.SerializeToString()
+  kwargs     sub-messages built first, then Message(field=value, sub=sub_message)
+  assign     empty Message, then fields (including sub-message fields) set in place
+  CopyFrom   empty Message, then CopyFrom(template)
+  MergeFrom  empty Message, then MergeFrom(template)
+  parse      Message.FromString(pre_serialized_bytes)
+
+Usage:
+  python benchmarks/protobuf_benchmark.py [seconds_per_case]
+"""
+import importlib
+import json
+import subprocess
+import sys
+import os
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+STUB_MODULES = ['service_pb2', 'weather_pb2', 'profile_pb2', 'gateway_pb2', 'admin_pb2']
+BACKENDS = ['upb', 'python']
+OPERATIONS = ['serialize', 'parse', 'kwargs', 'assign', 'CopyFrom', 'MergeFrom']
+
+
+def _sample_scalar(field):
+    from google.protobuf.descriptor import FieldDescriptor
+
+    if field.type == FieldDescriptor.TYPE_STRING:
+        return f"sample {field.name}"
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return b"sample"
+    if field.type == FieldDescriptor.TYPE_BOOL:
+        return True
+    if field.type in (FieldDescriptor.TYPE_DOUBLE, FieldDescriptor.TYPE_FLOAT):
+        return 21.5
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        return field.enum_type.values[-1].number
+    return 42
+
+
+class _Nested(dict):
+    """Field values of a sub-message (plain dicts are map fields)"""
+
+
+def sample_values(descriptor):
+    """Values populating every field of a message type, sub-messages included"""
+    values = {}
+    for field in descriptor.fields:
+        repeated = field.label == field.LABEL_REPEATED
+        if field.message_type is not None and field.message_type.GetOptions().map_entry:
+            value_field = field.message_type.fields_by_name['value']
+            values[field.name] = {f"key{i}": _sample_scalar(value_field) for i in range(3)}
+        elif field.message_type is not None:
+            sub_values = _Nested(sample_values(field.message_type))
+            values[field.name] = [sub_values] * 3 if repeated else sub_values
+        else:
+            value = _sample_scalar(field)
+            values[field.name] = [value] * 3 if repeated else value
+    return values
+
+
+def build_kwargs(cls, values, classes):
+    """Build sub-messages first and pass them as keyword arguments (gateway style)"""
+    kwargs = {}
+    for name, value in values.items():
+        field = cls.DESCRIPTOR.fields_by_name[name]
+        if isinstance(value, _Nested):
+            value = build_kwargs(classes[field.message_type.full_name], value, classes)
+        elif isinstance(value, list) and value and isinstance(value[0], _Nested):
+            sub_cls = classes[field.message_type.full_name]
+            value = [build_kwargs(sub_cls, item, classes) for item in value]
+        kwargs[name] = value
+    return cls(**kwargs)
+
+
+def build_assign(message, values):
+    """Fill fields in place, writing sub-message fields directly"""
+    for name, value in values.items():
+        if isinstance(value, _Nested):
+            build_assign(getattr(message, name), value)
+        elif isinstance(value, dict):
+            getattr(message, name).update(value)
+        elif isinstance(value, list) and value and isinstance(value[0], _Nested):
+            repeated = getattr(message, name)
+            for item in value:
+                build_assign(repeated.add(), item)
+        elif isinstance(value, list):
+            getattr(message, name).extend(value)
+        else:
+            setattr(message, name, value)
+    return message
+
+
+def run_cases(seconds):
+    """Benchmark every (message, operation) pair with the active backend"""
+    from grpc_common.protobuf_backend import backend
+
+    classes = {}
+    for module_name in STUB_MODULES:
+        module = importlib.import_module(f"grpc_stubs.{module_name}")
+        for name, descriptor in module.DESCRIPTOR.message_types_by_name.items():
+            classes[descriptor.full_name] = getattr(module, name)
+
+    results = []
+    for full_name, cls in sorted(classes.items()):
+        values = sample_values(cls.DESCRIPTOR)
+        template = build_kwargs(cls, values, classes)
+        data = template.SerializeToString()
+
+        def build_copy():
+            cls().CopyFrom(template)
+
+        def build_merge():
+            cls().MergeFrom(template)
+
+        cases = {
+            'serialize': template.SerializeToString,
+            'parse': lambda: cls.FromString(data),
+            'kwargs': lambda: build_kwargs(cls, values, classes),
+            'assign': lambda: build_assign(cls(), values),
+            'CopyFrom': build_copy,
+            'MergeFrom': build_merge
+        }
+        for operation, fn in cases.items():
+            timer = timeit.Timer(fn)
+            per_call = timer.timeit(number=20) / 20
+            number = max(1, int(seconds / max(per_call, 1e-9)))
+            best = min(timer.repeat(repeat=3, number=number)) / number
+            results.append({
+                "message": full_name,
+                "bytes": len(data),
+                "operation": operation,
+                "ns": best * 1e9
+            })
+
+    return {"backend": backend(), "results": results}
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        print(json.dumps(run_cases(float(sys.argv[2]))))
+        return
+
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    runs = {}
+    for requested in BACKENDS:
+        env = dict(os.environ, PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=requested)
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", str(seconds)],
+            env=env, capture_output=True, text=True
+        )
+        if child.returncode != 0:
+            print(f"⚠️  {requested} backend unavailable: {child.stderr.strip().splitlines()[-1:]}")
+            continue
+        run = json.loads(child.stdout)
+        if run["backend"] != requested:
+            print(f"⚠️  requested {requested} backend but got {run['backend']}; skipping")
+            continue
+        runs[requested] = {(r["message"], r["operation"]): r for r in run["results"]}
+
+    print("🧬 Protobuf Benchmark (ns per operation, lower is better)")
+    print("=" * 100)
+    backends = list(runs)
+    if not backends:
+        return
+
+    for backend_name in backends:
+        print(f"\n[{backend_name}]")
+        print(f"{'message':<36}{'bytes':>6}" + "".join(f"{op:>11}" for op in OPERATIONS))
+        messages = sorted({message for message, _ in runs[backend_name]})
+        for message in messages:
+            row = [runs[backend_name][(message, op)] for op in OPERATIONS]
+            print(f"{message:<36}{row[0]['bytes']:>6}" + "".join(f"{r['ns']:>11.0f}" for r in row))
+
+    if len(backends) > 1:
+        base, other = backends[0], backends[1]
+        print(f"\n{other} / {base} slowdown (geometric mean over all messages):")
+        for op in OPERATIONS:
+            ratios = [
+                runs[other][key]["ns"] / runs[base][key]["ns"]
+                for key in runs[base] if key[1] == op and key in runs[other]
+            ]
+            product = 1.0
+            for ratio in ratios:
+                product *= ratio
+            print(f"  {op:<10} {product ** (1 / len(ratios)):6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - time-to-first-served-RPC for every service
+Launches each server as a fresh process on a free port and measures the time
+until it answers its first RPC (AdminService.GetMetrics, which goes through
+the same server pipeline as every other RPC).
+
+Usage:
+  python benchmarks/startup_benchmark.py [runs]
+"""
+import grpc
+import socket
+import statistics
+import subprocess
+import sys
+import os
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from grpc_common.protobuf_backend import backend
+from grpc_stubs import admin_pb2, admin_pb2_grpc
+
+SERVICES = [
+    ('hello', 'service_b/server.py'),
+    ('profile', 'service_profile/server.py'),
+    ('weather', 'service_weather/server.py'),
+    ('gateway', 'service_gateway/server.py')
+]
+
+# Retry connecting every ~10ms instead of gRPC's default 1s initial backoff
+FAST_RECONNECT_OPTIONS = [
+    ('grpc.initial_reconnect_backoff_ms', 10),
+    ('grpc.min_reconnect_backoff_ms', 10),
+    ('grpc.max_reconnect_backoff_ms', 20)
+]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def measure_interpreter():
+    """Bare interpreter start-up, the floor for every service"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    return time.perf_counter() - start
+
+
+def measure_service(name, script):
+    port = free_port()
+    env = dict(os.environ)
+    env.pop('GRPC_UDS_DIR', None)
+    env[f"{name.upper()}_GRPC_LISTEN"] = f"127.0.0.1:{port}"
+
+    with grpc.insecure_channel(f"127.0.0.1:{port}", options=FAST_RECONNECT_OPTIONS) as channel:
+        stub = admin_pb2_grpc.AdminServiceStub(channel)
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, script)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            stub.GetMetrics(admin_pb2.MetricsRequest(), timeout=30, wait_for_ready=True)
+            return time.perf_counter() - start
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print("⏱️  Startup Benchmark (time to first served RPC)")
+    print("=" * 60)
+    print(f"Runs per service: {runs}, protobuf backend: {backend()}")
+
+    interpreter = [measure_interpreter() for _ in range(runs)]
+    print(f"\n{'service':<12}{'min ms':>10}{'median ms':>12}{'max ms':>10}")
+    print(f"{'(python)':<12}{min(interpreter) * 1000:>10.0f}"
+          f"{statistics.median(interpreter) * 1000:>12.0f}{max(interpreter) * 1000:>10.0f}")
+
+    for name, script in SERVICES:
+        try:
+            times = [measure_service(name, script) for _ in range(runs)]
+        except grpc.RpcError as e:
+            print(f"{name:<12}failed to start: {e.code()}")
+            continue
+        print(f"{name:<12}{min(times) * 1000:>10.0f}"
+              f"{statistics.median(times) * 1000:>12.0f}{max(times) * 1000:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Transport Benchmark - loopback TCP vs Unix domain socket
+Runs the Hello service in-process on both transports and reports per-call
+latency and CPU cost, plus the delta of UDS against TCP.
+
+Usage:
+  python benchmarks/transport_benchmark.py [calls] [payload_bytes]
+"""
+from concurrent import futures
+import grpc
+import sys
+import os
+import resource
+import statistics
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grpc_stubs import service_pb2, service_pb2_grpc
+
+
+class EchoHelloServicer(service_pb2_grpc.HelloServiceServicer):
+    """Hello servicer without logging so only transport cost is measured"""
+
+    def SayHello(self, request, context):
+        return service_pb2.HelloReply(message=request.name)
+
+
+def _cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_transport(name, listen_address, calls, payload):
+    """Benchmark one transport and return its summary"""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    service_pb2_grpc.add_HelloServiceServicer_to_server(EchoHelloServicer(), server)
+    port = server.add_insecure_port(listen_address)
+    server.start()
+
+    dial_address = listen_address
+    if not listen_address.startswith("unix:"):
+        dial_address = f"localhost:{port}"
+
+    try:
+        with grpc.insecure_channel(dial_address) as channel:
+            stub = service_pb2_grpc.HelloServiceStub(channel)
+            request = service_pb2.HelloRequest(name=payload)
+
+            # Warm up the connection before measuring
+            for _ in range(min(200, calls)):
+                stub.SayHello(request, timeout=5)
+
+            latencies = []
+            cpu_start = _cpu_seconds()
+            wall_start = time.perf_counter()
+            for _ in range(calls):
+                start = time.perf_counter()
+                stub.SayHello(request, timeout=5)
+                latencies.append(time.perf_counter() - start)
+            wall = time.perf_counter() - wall_start
+            cpu = _cpu_seconds() - cpu_start
+    finally:
+        server.stop(0)
+
+    latencies.sort()
+    return {
+        "transport": name,
+        "calls": calls,
+        "mean_us": statistics.mean(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e6,
+        "cpu_us_per_call": cpu / calls * 1e6,
+        "calls_per_second": calls / wall
+    }
+
+
+def _delta(uds, tcp, key):
+    return (uds[key] - tcp[key]) / tcp[key] * 100 if tcp[key] else 0.0
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    payload_bytes = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    payload = "x" * payload_bytes
+
+    socket_dir = tempfile.mkdtemp(prefix="grpc-bench-")
+    socket_path = os.path.join(socket_dir, "hello.sock")
+
+    print("📊 Transport Benchmark (Hello service, in-process)")
+    print("=" * 60)
+    print(f"Calls: {calls}, payload: {payload_bytes} bytes")
+
+    tcp = run_transport("tcp", "localhost:0", calls, payload)
+    uds = run_transport("uds", f"unix://{socket_path}", calls, payload)
+
+    print(f"\n{'transport':<10}{'mean µs':>10}{'p50 µs':>10}{'p99 µs':>10}{'cpu µs/call':>14}{'calls/s':>10}")
+    for result in (tcp, uds):
+        print(f"{result['transport']:<10}{result['mean_us']:>10.1f}{result['p50_us']:>10.1f}"
+              f"{result['p99_us']:>10.1f}{result['cpu_us_per_call']:>14.1f}{result['calls_per_second']:>10.0f}")
+
+    print("\nUDS vs TCP:")
+    print(f"  latency p50: {_delta(uds, tcp, 'p50_us'):+.1f}%")
+    print(f"  latency p99: {_delta(uds, tcp, 'p99_us'):+.1f}%")
+    print(f"  cpu/call:    {_delta(uds, tcp, 'cpu_us_per_call'):+.1f}%")
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    os.rmdir(socket_dir)
+
+
+if __name__ == "__main__":
+    main()
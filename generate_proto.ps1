@@ -1,11 +1,14 @@
-python -m grpc_tools.protoc --proto_path=proto --python_out=. --grpc_python_out=. proto/service.proto proto/weather.proto proto/profile.proto proto/gateway.proto
+# Generates the grpc_stubs package: the "grpc_stubs=proto" mapping makes the
+# generated *_pb2_grpc.py modules use package imports (from grpc_stubs import ...)
+python -m grpc_tools.protoc --proto_path=grpc_stubs=proto --python_out=. --grpc_python_out=. grpc_stubs/service.proto grpc_stubs/weather.proto grpc_stubs/profile.proto grpc_stubs/gateway.proto grpc_stubs/admin.proto
 
 if ($LASTEXITCODE -eq 0) {
-    Write-Host "Generated Python gRPC files:"
+    Write-Host "Generated Python gRPC files in grpc_stubs/:"
     Write-Host "  - service_pb2.py and service_pb2_grpc.py"
     Write-Host "  - weather_pb2.py and weather_pb2_grpc.py"
     Write-Host "  - profile_pb2.py and profile_pb2_grpc.py"
     Write-Host "  - gateway_pb2.py and gateway_pb2_grpc.py"
+    Write-Host "  - admin_pb2.py and admin_pb2_grpc.py"
 } else {
     Write-Host "protoc failed with exit code $LASTEXITCODE"
 }
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+Shared helpers used by every gRPC microservice in this project
+"""
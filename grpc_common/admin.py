@@ -0,0 +1,37 @@
+"""
+AdminService implementation registered on every microservice
+"""
+import grpc
+
+from grpc_common.protobuf_backend import backend
+from grpc_stubs import admin_pb2, admin_pb2_grpc
+
+
+class AdminServicer(admin_pb2_grpc.AdminServiceServicer):
+    def __init__(self, service_name, metrics, faults):
+        self.service_name = service_name
+        self.metrics = metrics
+        self.faults = faults
+
+    def GetMetrics(self, request, context):
+        return admin_pb2.MetricsReply(
+            service=self.service_name,
+            metrics=self.metrics.snapshot(request.prefix),
+            protobuf_backend=backend()
+        )
+
+    def SetFaults(self, request, context):
+        try:
+            rules = self.faults.set(request.rules, replace=request.replace)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        print(f"[{self.service_name}] ⚡ {len(rules)} fault rule(s) active")
+        return admin_pb2.FaultsReply(rules=rules)
+
+    def ClearFaults(self, request, context):
+        self.faults.clear()
+        print(f"[{self.service_name}] ⚡ Fault rules cleared")
+        return admin_pb2.FaultsReply()
+
+    def ListFaults(self, request, context):
+        return admin_pb2.FaultsReply(rules=self.faults.rules())
@@ -0,0 +1,378 @@
+"""
+Fault injection for latency and resilience testing
+
+Rules (admin.FaultRule) are matched against the full method name of every RPC
+a service receives (SERVER scope) and, on channels wrapped with
+intercept_channel(), every RPC it makes (CLIENT scope). A matching rule fires
+for `percentage` percent of calls and can add latency drawn from a
+distribution, fail the call with a status code, drop the response so the
+caller hits its deadline, or throttle response messages to a bandwidth cap.
+
+Rules are changed at runtime through AdminService.SetFaults / ClearFaults /
+ListFaults. AdminService is never faulted, so faults can always be cleared,
+and neither is grpc.health.v1.Health: a faulted health check would take the
+whole instance out of client-side load balancing instead of failing a share of
+its calls. With no rules active, calls pass through untouched.
+"""
+from collections import namedtuple
+from fnmatch import fnmatchcase
+import math
+import random
+import threading
+import time
+
+import grpc
+
+from grpc_common.handlers import wrap_handler
+from grpc_common.metrics import REGISTRY
+from grpc_stubs import admin_pb2
+
+# Control-plane services that rules never apply to, even with an empty method
+EXEMPT_METHOD_PREFIXES = ("/admin.AdminService/", "/grpc.health.v1.Health/")
+
+# Longest a dropped response holds its call open when the caller set no deadline
+MAX_DROP_HOLD_SECONDS = 30.0
+
+SERVER = admin_pb2.FaultRule.SERVER
+CLIENT = admin_pb2.FaultRule.CLIENT
+
+_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+
+def validate_rule(rule):
+    """Return an error message for an unusable FaultRule, or None"""
+    if not 0 <= rule.percentage <= 100:
+        return "percentage must be between 0 and 100"
+    if not all(math.isfinite(value) for value in (rule.latency_ms, rule.latency_jitter_ms, rule.bandwidth_kbps)):
+        return "latency_ms, latency_jitter_ms and bandwidth_kbps must be finite"
+    if rule.latency_ms < 0 or rule.latency_jitter_ms < 0:
+        return "latency_ms and latency_jitter_ms must not be negative"
+    if rule.bandwidth_kbps < 0:
+        return "bandwidth_kbps must not be negative"
+    if rule.error_code and rule.error_code not in _STATUS_CODES:
+        return f"error_code {rule.error_code} is not a gRPC status code"
+    if not rule.error_code and rule.error_message:
+        return "error_message requires a non-zero error_code"
+    return None
+
+
+class FaultInjector:
+    """The active fault rules of one process"""
+
+    def __init__(self, metrics, rng=None):
+        self._lock = threading.Lock()
+        self._rules = ()
+        self._metrics = metrics
+        self._random = rng or random.Random()
+
+    def set(self, rules, replace=False):
+        """Add (or with `replace`, swap in) rules; raise ValueError if one is invalid"""
+        copies = []
+        for index, rule in enumerate(rules):
+            error = validate_rule(rule)
+            if error:
+                raise ValueError(f"rule {index}: {error}")
+            copy = admin_pb2.FaultRule()
+            copy.CopyFrom(rule)
+            copies.append(copy)
+
+        with self._lock:
+            self._rules = tuple(copies) if replace else self._rules + tuple(copies)
+            return list(self._rules)
+
+    def clear(self):
+        with self._lock:
+            self._rules = ()
+
+    def rules(self):
+        return list(self._rules)
+
+    def select(self, method, scope):
+        """Return the rules that fire for one call of `method`"""
+        rules = self._rules
+        if not rules or method.startswith(EXEMPT_METHOD_PREFIXES):
+            return []
+        return [
+            rule for rule in rules
+            if rule.scope == scope
+            and (not rule.method or fnmatchcase(method, rule.method))
+            and self._random.random() * 100 < rule.percentage
+        ]
+
+    def latency(self, rule):
+        """Draw one injected delay, in seconds, from the rule's distribution"""
+        mean = rule.latency_ms
+        jitter = rule.latency_jitter_ms
+        distribution = rule.latency_distribution
+        if distribution == admin_pb2.FaultRule.UNIFORM:
+            delay = self._random.uniform(mean - jitter, mean + jitter)
+        elif distribution == admin_pb2.FaultRule.NORMAL:
+            delay = self._random.gauss(mean, jitter)
+        elif distribution == admin_pb2.FaultRule.EXPONENTIAL:
+            delay = self._random.expovariate(1 / mean) if mean > 0 else 0.0
+        else:
+            delay = mean
+        return max(delay, 0.0) / 1000
+
+    def record(self, scope, kind):
+        self._metrics.increment(f"faults.{admin_pb2.FaultRule.Scope.Name(scope).lower()}.{kind}")
+
+
+INJECTOR = FaultInjector(REGISTRY)
+
+
+def _transfer_seconds(message, rules):
+    """Time `message` takes to cross the tightest bandwidth cap among `rules`"""
+    caps = [rule.bandwidth_kbps for rule in rules if rule.bandwidth_kbps > 0]
+    if not caps or not hasattr(message, 'ByteSize'):
+        return 0.0
+    return message.ByteSize() * 8 / (min(caps) * 1000)
+
+
+def _error(rule):
+    code = _STATUS_CODES[rule.error_code]
+    return code, rule.error_message or f"Injected fault: {code.name}"
+
+
+class FaultInjectionInterceptor(grpc.ServerInterceptor):
+    """Applies SERVER-scope fault rules to the RPCs a service receives"""
+
+    def __init__(self, injector=INJECTOR):
+        self._injector = injector
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        rules = self._injector.select(handler_call_details.method, SERVER)
+        if not rules:
+            return handler
+        return wrap_handler(handler, lambda behavior: self._inject(behavior, rules, handler.response_streaming))
+
+    def _inject(self, behavior, rules, response_streaming):
+        injector = self._injector
+
+        def before(context):
+            for rule in rules:
+                delay = injector.latency(rule)
+                if delay:
+                    injector.record(SERVER, "latency")
+                    time.sleep(delay)
+                if rule.error_code:
+                    injector.record(SERVER, "error")
+                    context.abort(*_error(rule))
+
+        def drop(context):
+            injector.record(SERVER, "drop")
+            remaining = context.time_remaining()
+            time.sleep(min(remaining, MAX_DROP_HOLD_SECONDS) if remaining is not None else MAX_DROP_HOLD_SECONDS)
+            context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, "Injected fault: response dropped")
+
+        dropped = any(rule.drop_response for rule in rules)
+
+        def run(request_or_iterator, context):
+            before(context)
+            response = behavior(request_or_iterator, context)
+            if dropped:
+                drop(context)
+            delay = _transfer_seconds(response, rules)
+            if delay:
+                injector.record(SERVER, "bandwidth")
+                time.sleep(delay)
+            return response
+
+        def run_streaming(request_or_iterator, context):
+            before(context)
+            for response in behavior(request_or_iterator, context):
+                if dropped:
+                    continue
+                delay = _transfer_seconds(response, rules)
+                if delay:
+                    injector.record(SERVER, "bandwidth")
+                    time.sleep(delay)
+                yield response
+            if dropped:
+                drop(context)
+
+        return run_streaming if response_streaming else run
+
+
+class _ClientCallDetails(
+        namedtuple('_ClientCallDetails', ('method', 'timeout', 'metadata', 'credentials',
+                                          'wait_for_ready', 'compression')),
+        grpc.ClientCallDetails):
+    pass
+
+
+class InjectedRpcError(grpc.RpcError, grpc.Call, grpc.Future):
+    """A failed call produced by a CLIENT-scope fault instead of the network"""
+
+    def __init__(self, code, details):
+        super().__init__()
+        self._code = code
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+    def initial_metadata(self):
+        return ()
+
+    def trailing_metadata(self):
+        return ()
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+    def running(self):
+        return False
+
+    def done(self):
+        return True
+
+    def result(self, timeout=None):
+        raise self
+
+    def exception(self, timeout=None):
+        return self
+
+    def traceback(self, timeout=None):
+        return None
+
+    def add_callback(self, callback):
+        return False
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        raise self
+
+    def __str__(self):
+        return f"<InjectedRpcError {self._code.name}: {self._details}>"
+
+
+class _ThrottledStream:
+    """Response iterator that delays each message by its transfer time"""
+
+    def __init__(self, call, rules, injector):
+        self._call = call
+        self._rules = rules
+        self._injector = injector
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        response = next(self._call)
+        delay = _transfer_seconds(response, self._rules)
+        if delay:
+            self._injector.record(CLIENT, "bandwidth")
+            time.sleep(delay)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._call, name)
+
+
+class FaultInjectionClientInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """Applies CLIENT-scope fault rules to the RPCs a service makes"""
+
+    def __init__(self, injector=INJECTOR):
+        self._injector = injector
+
+    def _before(self, client_call_details, rules):
+        """Inject latency and errors; return (details for the real call, injected error)"""
+        timeout = client_call_details.timeout
+        for rule in rules:
+            delay = self._injector.latency(rule)
+            if delay:
+                self._injector.record(CLIENT, "latency")
+                if timeout is not None and delay >= timeout:
+                    time.sleep(timeout)
+                    return None, InjectedRpcError(
+                        grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline Exceeded (injected latency)"
+                    )
+                time.sleep(delay)
+                if timeout is not None:
+                    timeout -= delay
+            if rule.error_code:
+                self._injector.record(CLIENT, "error")
+                return None, InjectedRpcError(*_error(rule))
+
+        details = _ClientCallDetails(
+            client_call_details.method, timeout, client_call_details.metadata,
+            client_call_details.credentials, client_call_details.wait_for_ready,
+            client_call_details.compression
+        )
+        return details, None
+
+    def _drop(self, remaining):
+        self._injector.record(CLIENT, "drop")
+        time.sleep(min(remaining, MAX_DROP_HOLD_SECONDS) if remaining is not None else MAX_DROP_HOLD_SECONDS)
+        return InjectedRpcError(grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline Exceeded (injected drop)")
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        rules = self._injector.select(client_call_details.method, CLIENT)
+        if not rules:
+            return continuation(client_call_details, request)
+
+        details, error = self._before(client_call_details, rules)
+        if error is not None:
+            return error
+
+        started = time.monotonic()
+        outcome = continuation(details, request)
+        if any(rule.drop_response for rule in rules):
+            # The call completes downstream, but its response never arrives
+            outcome.exception()
+            remaining = None
+            if details.timeout is not None:
+                remaining = max(details.timeout - (time.monotonic() - started), 0.0)
+            return self._drop(remaining)
+
+        if outcome.exception() is None:
+            delay = _transfer_seconds(outcome.result(), rules)
+            if delay:
+                self._injector.record(CLIENT, "bandwidth")
+                time.sleep(delay)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        rules = self._injector.select(client_call_details.method, CLIENT)
+        if not rules:
+            return continuation(client_call_details, request)
+
+        details, error = self._before(client_call_details, rules)
+        if error is not None:
+            return error
+
+        call = continuation(details, request)
+        if any(rule.drop_response for rule in rules):
+            call.cancel()
+            return self._drop(details.timeout)
+        return _ThrottledStream(call, rules, self._injector)
+
+
+_CLIENT_INTERCEPTOR = FaultInjectionClientInterceptor()
+
+
+def intercept_channel(channel):
+    """Wrap a client channel so CLIENT-scope fault rules apply to its calls"""
+    return grpc.intercept_channel(channel, _CLIENT_INTERCEPTOR)
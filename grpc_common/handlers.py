@@ -0,0 +1,55 @@
+"""
+Helpers for server interceptors that wrap RPC method handlers
+"""
+import grpc
+
+
+def wrap_handler(handler, wrap):
+    """Return a copy of `handler` whose behavior is replaced by wrap(behavior)
+
+    `wrap` receives the original behavior (request_or_iterator, context) and
+    must return a callable with the same signature, so it works for all four
+    RPC shapes. grpc's experimental_non_blocking / experimental_thread_pool
+    markers are carried over to the wrapper, which must then pass any extra
+    arguments (send_response_callback) through to the behavior.
+    Without them a non-blocking handler such as health Watch would hold a
+    worker thread for the whole life of its stream.
+    """
+    if handler is None:
+        return None
+
+    if handler.request_streaming and handler.response_streaming:
+        factory, behavior = grpc.stream_stream_rpc_method_handler, handler.stream_stream
+    elif handler.request_streaming:
+        factory, behavior = grpc.stream_unary_rpc_method_handler, handler.stream_unary
+    elif handler.response_streaming:
+        factory, behavior = grpc.unary_stream_rpc_method_handler, handler.unary_stream
+    else:
+        factory, behavior = grpc.unary_unary_rpc_method_handler, handler.unary_unary
+
+    wrapped = wrap(behavior)
+    for marker in ('experimental_non_blocking', 'experimental_thread_pool'):
+        if hasattr(behavior, marker):
+            setattr(wrapped, marker, getattr(behavior, marker))
+
+    return factory(
+        wrapped,
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer
+    )
+
+
+def abort_handler(handler, code, details):
+    """Return a handler with the same shape as `handler` that fails immediately"""
+    def wrap(_behavior):
+        def aborted(_request, context, *_args, **_kwargs):
+            context.abort(code, details)
+        return aborted
+    return wrap_handler(handler, wrap)
+
+
+def metadata_value(handler_call_details, key, default=None):
+    for name, value in handler_call_details.invocation_metadata or ():
+        if name == key:
+            return value
+    return default
@@ -0,0 +1,70 @@
+"""
+In-process metrics registry exposed through AdminService.GetMetrics
+"""
+from collections import deque
+import threading
+
+
+class _Summary:
+    __slots__ = ('count', 'total', 'maximum', 'samples')
+
+    def __init__(self, reservoir_size):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.samples = deque(maxlen=reservoir_size)
+
+
+class MetricsRegistry:
+    """Thread-safe counters, gauges and latency summaries"""
+
+    def __init__(self, reservoir_size=2048):
+        self._lock = threading.Lock()
+        self._reservoir_size = reservoir_size
+        self._counters = {}
+        self._gauges = {}
+        self._summaries = {}
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def gauge(self, name, read):
+        """Register a callable sampled every time a snapshot is taken"""
+        with self._lock:
+            self._gauges[name] = read
+
+    def observe(self, name, value):
+        """Record one sample; p50/p99 are computed over the most recent samples"""
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                summary = self._summaries[name] = _Summary(self._reservoir_size)
+            summary.count += 1
+            summary.total += value
+            summary.maximum = max(summary.maximum, value)
+            summary.samples.append(value)
+
+    def snapshot(self, prefix=""):
+        """Return a flat {metric_name: value} dict"""
+        with self._lock:
+            values = dict(self._counters)
+            gauges = list(self._gauges.items())
+            summaries = [
+                (name, summary.count, summary.total, summary.maximum, sorted(summary.samples))
+                for name, summary in self._summaries.items()
+            ]
+
+        for name, read in gauges:
+            values[name] = float(read())
+        for name, count, total, maximum, samples in summaries:
+            values[f"{name}.count"] = count
+            values[f"{name}.mean"] = total / count
+            values[f"{name}.max"] = maximum
+            values[f"{name}.p50"] = samples[len(samples) // 2]
+            values[f"{name}.p99"] = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+        return {name: float(value) for name, value in values.items() if name.startswith(prefix)}
+
+
+REGISTRY = MetricsRegistry()
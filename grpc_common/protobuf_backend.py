@@ -0,0 +1,24 @@
+"""
+Detection of the active protobuf runtime backend
+
+protobuf 4.x ships three implementations: `upb` (C, the default wheel
+backend), `cpp` (legacy C++) and `python` (pure Python, many times slower at
+parsing and serializing). The pure-Python backend is silently selected when no
+compiled wheel matches the platform or when
+PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python is set.
+"""
+from google.protobuf.internal import api_implementation
+
+
+def backend():
+    """Return 'upb', 'cpp' or 'python'"""
+    return api_implementation.Type()
+
+
+def warn_if_pure_python(service):
+    """Print a warning when the slow pure-Python backend is active"""
+    active = backend()
+    if active == 'python':
+        print(f"⚠️  [{service}] protobuf is using the pure-Python backend; "
+              "install a protobuf wheel with the upb backend for faster (de)serialization")
+    return active
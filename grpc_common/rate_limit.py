@@ -0,0 +1,74 @@
+"""
+Token-bucket rate limiting with bounded memory
+
+Buckets are spread over independently locked shards so concurrent callers
+rarely contend, and each shard keeps its keys in LRU order so idle keys are
+evicted once the shard is full. Every decision is O(1): one dict lookup, one
+LRU move and a lazy refill computed from the time since the bucket was last
+touched.
+"""
+from collections import OrderedDict
+import threading
+import time
+
+
+class _Bucket:
+    __slots__ = ('tokens', 'updated')
+
+    def __init__(self, tokens, updated):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class _Shard:
+    __slots__ = ('lock', 'buckets')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = OrderedDict()
+
+
+class RateLimiter:
+    """Per-key token buckets refilled at `rate` tokens/second up to `burst`"""
+
+    def __init__(self, rate, burst, shards=16, max_keys_per_shard=4096, clock=time.monotonic):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.max_keys_per_shard = max_keys_per_shard
+        self._clock = clock
+        self._shards = [_Shard() for _ in range(shards)]
+
+    def acquire(self, key):
+        """Take one token for `key`; return 0.0 if allowed, else seconds to wait"""
+        shard = self._shards[hash(key) % len(self._shards)]
+        now = self._clock()
+
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                if len(shard.buckets) >= self.max_keys_per_shard:
+                    shard.buckets.popitem(last=False)
+                bucket = _Bucket(self.burst, now)
+                shard.buckets[key] = bucket
+            else:
+                shard.buckets.move_to_end(key)
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+                bucket.updated = now
+
+            if bucket.tokens >= 1.0:
+                bucket.tokens -= 1.0
+                return 0.0
+            return (1.0 - bucket.tokens) / self.rate
+
+    def refund(self, key):
+        """Return a token taken by acquire() for a call that was rejected elsewhere"""
+        shard = self._shards[hash(key) % len(self._shards)]
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is not None:
+                bucket.tokens = min(self.burst, bucket.tokens + 1.0)
+
+    def __len__(self):
+        return sum(len(shard.buckets) for shard in self._shards)
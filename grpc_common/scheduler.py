@@ -0,0 +1,190 @@
+"""
+Priority scheduling and bounded admission for gRPC server thread pools
+
+grpc.server() hands every accepted RPC to `thread_pool.submit()` right after
+running the server interceptors on the same thread. AdmissionInterceptor reads
+the caller's priority class from the `x-priority` metadata and leaves it in a
+thread-local slot that PriorityThreadPool.submit() consumes, so interactive
+work is dequeued ahead of default and batch work.
+
+The queue is bounded through grpc's own `maximum_concurrent_rpcs` (running +
+queued RPCs), batch traffic is shed earlier once more RPCs than its own limit
+are already queued (a limit of 0 admits batch calls only while nothing is
+waiting, so an idle server never sheds them), and requests whose deadline
+expired while they were queued are dropped at dequeue instead of being
+executed for a caller that has already given up.
+
+gRPC itself discards a queued unary call whose deadline passed (or whose
+caller cancelled) before its handler runs, so such drops are counted by the
+pool: each admitted RPC carries a ticket the handler marks when it starts,
+and a ticket still unmarked once the pool has run the call is a drop.
+"""
+from concurrent import futures
+import heapq
+import itertools
+import threading
+import time
+
+import grpc
+
+from grpc_common.handlers import abort_handler, metadata_value, wrap_handler
+
+PRIORITY_METADATA_KEY = 'x-priority'
+
+INTERACTIVE = 0
+DEFAULT = 1
+BATCH = 2
+
+PRIORITY_CLASSES = {
+    'interactive': INTERACTIVE,
+    'default': DEFAULT,
+    'batch': BATCH
+}
+PRIORITY_NAMES = {value: name for name, value in PRIORITY_CLASSES.items()}
+
+_pending = threading.local()
+
+
+class _Ticket:
+    """Marks whether an admitted RPC's handler actually started"""
+    __slots__ = ('started',)
+
+    def __init__(self):
+        self.started = False
+
+
+def priority_metadata(priority_name):
+    """Client-side metadata tuple that selects a priority class"""
+    return ((PRIORITY_METADATA_KEY, priority_name),)
+
+
+class PriorityThreadPool(futures.Executor):
+    """Fixed-size worker pool that runs queued work in priority order"""
+
+    def __init__(self, max_workers, metrics, thread_name_prefix="grpc-worker"):
+        self._max_workers = max_workers
+        self._metrics = metrics
+        self._thread_name_prefix = thread_name_prefix
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._threads = []
+        self._busy = 0
+        self._shutdown = False
+
+    def submit(self, fn, *args, **kwargs):
+        priority = getattr(_pending, 'priority', DEFAULT)
+        ticket = getattr(_pending, 'ticket', None)
+        _pending.priority = DEFAULT
+        _pending.ticket = None
+
+        future = futures.Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            heapq.heappush(
+                self._queue,
+                (priority, next(self._sequence), time.monotonic(), ticket, future, fn, args, kwargs)
+            )
+            if len(self._threads) < self._max_workers and self._busy + len(self._queue) > len(self._threads):
+                self._start_worker()
+            self._condition.notify()
+        return future
+
+    def _start_worker(self):
+        thread = threading.Thread(
+            target=self._worker,
+            name=f"{self._thread_name_prefix}-{len(self._threads)}",
+            daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                priority, _, enqueued, ticket, future, fn, args, kwargs = heapq.heappop(self._queue)
+                self._busy += 1
+
+            queue_ms = (time.monotonic() - enqueued) * 1000
+            self._metrics.observe("queue_time_ms", queue_ms)
+            self._metrics.observe(f"queue_time_ms.{PRIORITY_NAMES[priority]}", queue_ms)
+
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as exception:  # pylint: disable=broad-except
+                        future.set_exception(exception)
+            finally:
+                if ticket is not None and not ticket.started:
+                    self._metrics.increment("rpcs_dropped_in_queue")
+                with self._condition:
+                    self._busy -= 1
+
+    def queue_depth(self):
+        with self._condition:
+            return len(self._queue)
+
+    def busy_workers(self):
+        with self._condition:
+            return self._busy
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for item in self._queue:
+                    item[4].cancel()
+                self._queue.clear()
+            self._condition.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+class AdmissionInterceptor(grpc.ServerInterceptor):
+    """Tags each RPC with its priority class and enforces admission rules"""
+
+    def __init__(self, pool, metrics, batch_queue_limit):
+        self._pool = pool
+        self._metrics = metrics
+        self._batch_queue_limit = batch_queue_limit
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        priority_name = metadata_value(handler_call_details, PRIORITY_METADATA_KEY, 'default')
+        priority = PRIORITY_CLASSES.get(priority_name, DEFAULT)
+
+        if priority == BATCH and self._pool.queue_depth() > self._batch_queue_limit:
+            self._metrics.increment("rpcs_shed.batch")
+            _pending.priority = INTERACTIVE
+            _pending.ticket = None
+            return abort_handler(
+                handler,
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                "Server busy: batch request shed"
+            )
+
+        ticket = _Ticket()
+        _pending.priority = priority
+        _pending.ticket = ticket
+        return wrap_handler(handler, lambda behavior: self._drop_if_expired(behavior, ticket))
+
+    def _drop_if_expired(self, behavior, ticket):
+        def run(request_or_iterator, context, *args, **kwargs):
+            remaining = context.time_remaining()
+            if remaining is not None and remaining <= 0:
+                # Counted by the pool as rpcs_dropped_in_queue
+                context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline expired while queued")
+            ticket.started = True
+            return behavior(request_or_iterator, context, *args, **kwargs)
+        return run
@@ -0,0 +1,74 @@
+"""
+Common gRPC server construction for the microservices
+
+Settings are read from `<SERVICE>_GRPC_<NAME>` and fall back to
+`GRPC_<NAME>`, e.g. PROFILE_GRPC_MAX_WORKERS or GRPC_MAX_WORKERS:
+
+- MAX_WORKERS: worker threads executing RPCs (default 10)
+- MAX_QUEUED: RPCs allowed to wait for a worker before new ones are rejected
+  with RESOURCE_EXHAUSTED (default 50)
+- BATCH_QUEUE_LIMIT: queue depth at which batch-priority RPCs are shed
+  (default half of MAX_QUEUED)
+- SHUTDOWN_GRACE: seconds in-flight RPCs get to finish on SIGTERM (default 30)
+- DRAIN_DELAY: seconds to keep serving after reporting NOT_SERVING, so
+  health-checking clients move away first (default 0)
+- METRICS_SNAPSHOT_DIR: directory the final metrics snapshot is written to on
+  shutdown (default: not written)
+
+Every server also exposes the standard grpc.health.v1 Health service and
+applies the fault-injection rules set through AdminService (see faults.py).
+"""
+import os
+
+import grpc
+from grpc_health.v1 import health, health_pb2_grpc
+
+from grpc_stubs import admin_pb2_grpc
+from grpc_common.admin import AdminServicer
+from grpc_common.faults import INJECTOR, FaultInjectionInterceptor
+from grpc_common.metrics import REGISTRY
+from grpc_common.protobuf_backend import warn_if_pure_python
+from grpc_common.scheduler import AdmissionInterceptor, PriorityThreadPool
+from grpc_common.shutdown import GracefulShutdown
+
+
+def setting(service, name, default, cast=int):
+    value = os.environ.get(f"{service.upper()}_GRPC_{name}", os.environ.get(f"GRPC_{name}"))
+    return cast(value) if value else default
+
+
+def create_server(service, interceptors=()):
+    """Build a grpc.Server with priority scheduling, bounded queueing, health and AdminService
+
+    `server.graceful_shutdown.wait()` serves until SIGTERM/SIGINT and then drains.
+    """
+    warn_if_pure_python(service)
+
+    max_workers = setting(service, 'MAX_WORKERS', 10)
+    max_queued = setting(service, 'MAX_QUEUED', 50)
+    batch_queue_limit = setting(service, 'BATCH_QUEUE_LIMIT', max_queued // 2)
+
+    pool = PriorityThreadPool(max_workers, REGISTRY, thread_name_prefix=f"{service}-worker")
+    REGISTRY.gauge("queue_depth", pool.queue_depth)
+    REGISTRY.gauge("busy_workers", pool.busy_workers)
+
+    server = grpc.server(
+        pool,
+        interceptors=[
+            AdmissionInterceptor(pool, REGISTRY, batch_queue_limit),
+            FaultInjectionInterceptor(INJECTOR),
+            *interceptors
+        ],
+        maximum_concurrent_rpcs=max_workers + max_queued
+    )
+    admin_pb2_grpc.add_AdminServiceServicer_to_server(AdminServicer(service, REGISTRY, INJECTOR), server)
+
+    health_servicer = health.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    server.graceful_shutdown = GracefulShutdown(
+        service, server, health_servicer, pool, REGISTRY,
+        grace=setting(service, 'SHUTDOWN_GRACE', 30.0, cast=float),
+        drain_delay=setting(service, 'DRAIN_DELAY', 0.0, cast=float),
+        snapshot_dir=setting(service, 'METRICS_SNAPSHOT_DIR', None, cast=str)
+    )
+    return server
@@ -0,0 +1,100 @@
+"""
+Graceful shutdown and connection draining
+
+On SIGTERM (or Ctrl+C) a server:
+
+1. flips its grpc.health.v1 status to NOT_SERVING so health-checking clients
+   and load balancers stop sending it new work,
+2. waits DRAIN_DELAY seconds for them to notice while still serving,
+3. calls server.stop(SHUTDOWN_GRACE): listeners close, HTTP/2 GOAWAY is sent on
+   every connection and in-flight RPCs get up to SHUTDOWN_GRACE seconds to
+   finish before they are cancelled,
+4. runs drain hooks, which end long-lived streams so their clients reconnect
+   to another instance instead of holding the drain open,
+5. runs exit hooks (flushing caches, stopping background threads) and writes a
+   final metrics snapshot to METRICS_SNAPSHOT_DIR when it is set.
+
+A second signal skips whatever is left of the grace period.
+"""
+import json
+import os
+import signal
+import threading
+import time
+
+from grpc_health.v1 import health_pb2
+
+
+class GracefulShutdown:
+    def __init__(self, service, server, health, pool, metrics, grace, drain_delay=0.0, snapshot_dir=None):
+        self.service = service
+        self.server = server
+        self.health = health
+        self.pool = pool
+        self.metrics = metrics
+        self.grace = grace
+        self.drain_delay = drain_delay
+        self.snapshot_dir = snapshot_dir
+        self._requested = threading.Event()
+        self._drain_hooks = []
+        self._exit_hooks = []
+
+    def add_drain_hook(self, hook):
+        """Call `hook()` once the listeners are closed, while in-flight RPCs drain"""
+        self._drain_hooks.append(hook)
+
+    def add_exit_hook(self, hook):
+        """Call `hook()` after the server has stopped"""
+        self._exit_hooks.append(hook)
+
+    def request(self, signum=None, frame=None):
+        if self._requested.is_set():
+            print(f"\n⏩ [{self.service}] Second stop signal, cancelling in-flight RPCs")
+            self.server.stop(0)
+            return
+        self._requested.set()
+
+    def wait(self):
+        """Serve until SIGTERM/SIGINT, then drain and clean up"""
+        self.health.set("", health_pb2.HealthCheckResponse.SERVING)
+        signal.signal(signal.SIGTERM, self.request)
+        signal.signal(signal.SIGINT, self.request)
+        while not self._requested.wait(timeout=1.0):
+            pass
+        self.drain()
+
+    def drain(self):
+        in_flight = self.pool.busy_workers() + self.pool.queue_depth()
+        print(f"\n⏹️  [{self.service}] Draining: {in_flight} RPCs in flight, grace {self.grace:g}s")
+        started = time.monotonic()
+
+        self.health.enter_graceful_shutdown()
+        if self.drain_delay > 0:
+            time.sleep(self.drain_delay)
+
+        stopped = self.server.stop(self.grace)
+        self._run_hooks(self._drain_hooks)
+        stopped.wait()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        elapsed = time.monotonic() - started
+        self.metrics.observe("shutdown.drain_ms", elapsed * 1000)
+
+        self._run_hooks(self._exit_hooks)
+        self._write_snapshot()
+        print(f"✅ [{self.service}] Stopped after {elapsed:.2f}s")
+
+    def _run_hooks(self, hooks):
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as e:
+                print(f"⚠️  [{self.service}] Shutdown hook failed: {e}")
+
+    def _write_snapshot(self):
+        if not self.snapshot_dir:
+            return
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        path = os.path.join(self.snapshot_dir, f"{self.service}-{os.getpid()}.json")
+        with open(path, "w") as f:
+            json.dump({"service": self.service, "metrics": self.metrics.snapshot()}, f, indent=2, sort_keys=True)
+        print(f"📊 [{self.service}] Metrics snapshot written to {path}")
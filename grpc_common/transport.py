@@ -0,0 +1,75 @@
+"""
+Listen/dial address configuration for the gRPC microservices
+
+By default every service listens on TCP ``[::]:<port>`` and clients dial
+``localhost:<port>``. For co-located services a Unix domain socket avoids the
+loopback TCP stack entirely:
+
+- ``GRPC_UDS_DIR=/run/grpc`` makes every server additionally listen on
+  ``unix:///run/grpc/<service>.sock`` and makes clients prefer that socket
+  whenever it exists.
+- ``<SERVICE>_GRPC_LISTEN`` (e.g. ``PROFILE_GRPC_LISTEN``) replaces the listen
+  addresses of one server with a comma separated list, so a server can listen
+  on ``unix:`` only, TCP only, or both.
+- ``<SERVICE>_GRPC_TARGET`` (e.g. ``WEATHER_GRPC_TARGET``) forces the address
+  clients use to reach one service.
+"""
+import os
+
+SERVICE_PORTS = {
+    'hello': 50051,
+    'weather': 50052,
+    'profile': 50053,
+    'gateway': 50054
+}
+
+UNIX_PREFIX = 'unix://'
+
+
+def _env_name(service, suffix):
+    return f"{service.upper()}_GRPC_{suffix}"
+
+
+def uds_path(service):
+    """Return the Unix socket path for a service, or None if UDS is disabled"""
+    uds_dir = os.environ.get('GRPC_UDS_DIR')
+    if not uds_dir:
+        return None
+    return os.path.join(os.path.abspath(uds_dir), f"{service}.sock")
+
+
+def listen_addresses(service):
+    """Return every address a service's server should bind to"""
+    configured = os.environ.get(_env_name(service, 'LISTEN'))
+    if configured:
+        return [address.strip() for address in configured.split(',') if address.strip()]
+
+    addresses = [f"[::]:{SERVICE_PORTS[service]}"]
+    path = uds_path(service)
+    if path:
+        addresses.append(UNIX_PREFIX + path)
+    return addresses
+
+
+def add_listen_ports(server, service):
+    """Bind a grpc.Server to all configured addresses and return them"""
+    addresses = listen_addresses(service)
+    for address in addresses:
+        if address.startswith(UNIX_PREFIX):
+            socket_dir = os.path.dirname(address[len(UNIX_PREFIX):])
+            if socket_dir:
+                os.makedirs(socket_dir, exist_ok=True)
+        server.add_insecure_port(address)
+    return addresses
+
+
+def target(service):
+    """Return the address clients should dial, preferring a Unix socket"""
+    configured = os.environ.get(_env_name(service, 'TARGET'))
+    if configured:
+        return configured
+
+    path = uds_path(service)
+    if path and os.path.exists(path):
+        return UNIX_PREFIX + path
+    return f"localhost:{SERVICE_PORTS[service]}"
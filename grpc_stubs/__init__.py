@@ -0,0 +1,5 @@
+"""
+Precompiled Protocol Buffer and gRPC modules for every proto in proto/
+
+Regenerate after editing a .proto file with .\generate_proto.ps1
+"""
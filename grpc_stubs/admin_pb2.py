@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grpc_stubs/admin.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16grpc_stubs/admin.proto\x12\x05\x61\x64min\" \n\x0eMetricsRequest\x12\x0e\n\x06prefix\x18\x01 \x01(\t\"\x9c\x01\n\x0cMetricsReply\x12\x0f\n\x07service\x18\x01 \x01(\t\x12\x31\n\x07metrics\x18\x02 \x03(\x0b\x32 .admin.MetricsReply.MetricsEntry\x12\x18\n\x10protobuf_backend\x18\x03 \x01(\t\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\"\x82\x03\n\tFaultRule\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\x12\n\npercentage\x18\x02 \x01(\x01\x12%\n\x05scope\x18\x03 \x01(\x0e\x32\x16.admin.FaultRule.Scope\x12\x12\n\nlatency_ms\x18\x04 \x01(\x01\x12\x19\n\x11latency_jitter_ms\x18\x05 \x01(\x01\x12;\n\x14latency_distribution\x18\x06 \x01(\x0e\x32\x1d.admin.FaultRule.Distribution\x12\x12\n\nerror_code\x18\x07 \x01(\x05\x12\x15\n\rerror_message\x18\x08 \x01(\t\x12\x15\n\rdrop_response\x18\t \x01(\x08\x12\x16\n\x0e\x62\x61ndwidth_kbps\x18\n \x01(\x01\"\x1f\n\x05Scope\x12\n\n\x06SERVER\x10\x00\x12\n\n\x06\x43LIENT\x10\x01\"C\n\x0c\x44istribution\x12\t\n\x05\x46IXED\x10\x00\x12\x0b\n\x07UNIFORM\x10\x01\x12\n\n\x06NORMAL\x10\x02\x12\x0f\n\x0b\x45XPONENTIAL\x10\x03\"D\n\x10SetFaultsRequest\x12\x1f\n\x05rules\x18\x01 \x03(\x0b\x32\x10.admin.FaultRule\x12\x0f\n\x07replace\x18\x02 \x01(\x08\"\x14\n\x12\x43learFaultsRequest\"\x13\n\x11ListFaultsRequest\".\n\x0b\x46\x61ultsReply\x12\x1f\n\x05rules\x18\x01 \x03(\x0b\x32\x10.admin.FaultRule2\x84\x02\n\x0c\x41\x64minService\x12:\n\nGetMetrics\x12\x15.admin.MetricsRequest\x1a\x13.admin.MetricsReply\"\x00\x12:\n\tSetFaults\x12\x17.admin.SetFaultsRequest\x1a\x12.admin.FaultsReply\"\x00\x12>\n\x0b\x43learFaults\x12\x19.admin.ClearFaultsRequest\x1a\x12.admin.FaultsReply\"\x00\x12<\n\nListFaults\x12\x18.admin.ListFaultsRequest\x1a\x12.admin.FaultsReply\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_stubs.admin_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _METRICSREPLY_METRICSENTRY._options = None
+  _METRICSREPLY_METRICSENTRY._serialized_options = b'8\001'
+  _globals['_METRICSREQUEST']._serialized_start=33
+  _globals['_METRICSREQUEST']._serialized_end=65
+  _globals['_METRICSREPLY']._serialized_start=68
+  _globals['_METRICSREPLY']._serialized_end=224
+  _globals['_METRICSREPLY_METRICSENTRY']._serialized_start=178
+  _globals['_METRICSREPLY_METRICSENTRY']._serialized_end=224
+  _globals['_FAULTRULE']._serialized_start=227
+  _globals['_FAULTRULE']._serialized_end=613
+  _globals['_FAULTRULE_SCOPE']._serialized_start=513
+  _globals['_FAULTRULE_SCOPE']._serialized_end=544
+  _globals['_FAULTRULE_DISTRIBUTION']._serialized_start=546
+  _globals['_FAULTRULE_DISTRIBUTION']._serialized_end=613
+  _globals['_SETFAULTSREQUEST']._serialized_start=615
+  _globals['_SETFAULTSREQUEST']._serialized_end=683
+  _globals['_CLEARFAULTSREQUEST']._serialized_start=685
+  _globals['_CLEARFAULTSREQUEST']._serialized_end=705
+  _globals['_LISTFAULTSREQUEST']._serialized_start=707
+  _globals['_LISTFAULTSREQUEST']._serialized_end=726
+  _globals['_FAULTSREPLY']._serialized_start=728
+  _globals['_FAULTSREPLY']._serialized_end=774
+  _globals['_ADMINSERVICE']._serialized_start=777
+  _globals['_ADMINSERVICE']._serialized_end=1037
+# @@protoc_insertion_point(module_scope)
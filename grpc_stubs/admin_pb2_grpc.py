@@ -0,0 +1,166 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from grpc_stubs import admin_pb2 as grpc__stubs_dot_admin__pb2
+
+
+class AdminServiceStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetMetrics = channel.unary_unary(
+                '/admin.AdminService/GetMetrics',
+                request_serializer=grpc__stubs_dot_admin__pb2.MetricsRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_admin__pb2.MetricsReply.FromString,
+                )
+        self.SetFaults = channel.unary_unary(
+                '/admin.AdminService/SetFaults',
+                request_serializer=grpc__stubs_dot_admin__pb2.SetFaultsRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_admin__pb2.FaultsReply.FromString,
+                )
+        self.ClearFaults = channel.unary_unary(
+                '/admin.AdminService/ClearFaults',
+                request_serializer=grpc__stubs_dot_admin__pb2.ClearFaultsRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_admin__pb2.FaultsReply.FromString,
+                )
+        self.ListFaults = channel.unary_unary(
+                '/admin.AdminService/ListFaults',
+                request_serializer=grpc__stubs_dot_admin__pb2.ListFaultsRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_admin__pb2.FaultsReply.FromString,
+                )
+
+
+class AdminServiceServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def GetMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SetFaults(self, request, context):
+        """Runtime fault injection (AdminService and health checks are never faulted)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ClearFaults(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListFaults(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_AdminServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetrics,
+                    request_deserializer=grpc__stubs_dot_admin__pb2.MetricsRequest.FromString,
+                    response_serializer=grpc__stubs_dot_admin__pb2.MetricsReply.SerializeToString,
+            ),
+            'SetFaults': grpc.unary_unary_rpc_method_handler(
+                    servicer.SetFaults,
+                    request_deserializer=grpc__stubs_dot_admin__pb2.SetFaultsRequest.FromString,
+                    response_serializer=grpc__stubs_dot_admin__pb2.FaultsReply.SerializeToString,
+            ),
+            'ClearFaults': grpc.unary_unary_rpc_method_handler(
+                    servicer.ClearFaults,
+                    request_deserializer=grpc__stubs_dot_admin__pb2.ClearFaultsRequest.FromString,
+                    response_serializer=grpc__stubs_dot_admin__pb2.FaultsReply.SerializeToString,
+            ),
+            'ListFaults': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListFaults,
+                    request_deserializer=grpc__stubs_dot_admin__pb2.ListFaultsRequest.FromString,
+                    response_serializer=grpc__stubs_dot_admin__pb2.FaultsReply.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'admin.AdminService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class AdminService(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/admin.AdminService/GetMetrics',
+            grpc__stubs_dot_admin__pb2.MetricsRequest.SerializeToString,
+            grpc__stubs_dot_admin__pb2.MetricsReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def SetFaults(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/admin.AdminService/SetFaults',
+            grpc__stubs_dot_admin__pb2.SetFaultsRequest.SerializeToString,
+            grpc__stubs_dot_admin__pb2.FaultsReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ClearFaults(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/admin.AdminService/ClearFaults',
+            grpc__stubs_dot_admin__pb2.ClearFaultsRequest.SerializeToString,
+            grpc__stubs_dot_admin__pb2.FaultsReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ListFaults(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/admin.AdminService/ListFaults',
+            grpc__stubs_dot_admin__pb2.ListFaultsRequest.SerializeToString,
+            grpc__stubs_dot_admin__pb2.FaultsReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grpc_stubs/gateway.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18grpc_stubs/gateway.proto\x12\x07gateway\"#\n\x10\x44\x61shboardRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"\x9c\x01\n\x0e\x44\x61shboardReply\x12\x10\n\x08greeting\x18\x01 \x01(\t\x12$\n\tuser_info\x18\x02 \x01(\x0b\x32\x11.gateway.UserInfo\x12*\n\x0cweather_info\x18\x03 \x01(\x0b\x32\x14.gateway.WeatherInfo\x12\x0f\n\x07success\x18\x04 \x01(\x08\x12\x15\n\rerror_message\x18\x05 \x01(\t\"%\n\x12UserWeatherRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"\x85\x01\n\x10UserWeatherReply\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12*\n\x0cweather_info\x18\x03 \x01(\x0b\x32\x14.gateway.WeatherInfo\x12\x0f\n\x07success\x18\x04 \x01(\x08\x12\x15\n\rerror_message\x18\x05 \x01(\t\"\\\n\x08UserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0epreferred_city\x18\x03 \x01(\t\x12\x19\n\x11preferred_country\x18\x04 \x01(\t\"\x84\x01\n\x0bWeatherInfo\x12\x0c\n\x04\x63ity\x18\x01 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x02 \x01(\t\x12\x1b\n\x13temperature_celsius\x18\x03 \x01(\x01\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x10\n\x08humidity\x18\x05 \x01(\x01\x12\x12\n\nwind_speed\x18\x06 \x01(\x01\x32\xa2\x01\n\x0eGatewayService\x12\x44\n\x0cGetDashboard\x12\x19.gateway.DashboardRequest\x1a\x17.gateway.DashboardReply\"\x00\x12J\n\x0eGetUserWeather\x12\x1b.gateway.UserWeatherRequest\x1a\x19.gateway.UserWeatherReply\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_stubs.gateway_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _globals['_DASHBOARDREQUEST']._serialized_start=37
+  _globals['_DASHBOARDREQUEST']._serialized_end=72
+  _globals['_DASHBOARDREPLY']._serialized_start=75
+  _globals['_DASHBOARDREPLY']._serialized_end=231
+  _globals['_USERWEATHERREQUEST']._serialized_start=233
+  _globals['_USERWEATHERREQUEST']._serialized_end=270
+  _globals['_USERWEATHERREPLY']._serialized_start=273
+  _globals['_USERWEATHERREPLY']._serialized_end=406
+  _globals['_USERINFO']._serialized_start=408
+  _globals['_USERINFO']._serialized_end=500
+  _globals['_WEATHERINFO']._serialized_start=503
+  _globals['_WEATHERINFO']._serialized_end=635
+  _globals['_GATEWAYSERVICE']._serialized_start=638
+  _globals['_GATEWAYSERVICE']._serialized_end=800
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,99 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from grpc_stubs import gateway_pb2 as grpc__stubs_dot_gateway__pb2
+
+
+class GatewayServiceStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetDashboard = channel.unary_unary(
+                '/gateway.GatewayService/GetDashboard',
+                request_serializer=grpc__stubs_dot_gateway__pb2.DashboardRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_gateway__pb2.DashboardReply.FromString,
+                )
+        self.GetUserWeather = channel.unary_unary(
+                '/gateway.GatewayService/GetUserWeather',
+                request_serializer=grpc__stubs_dot_gateway__pb2.UserWeatherRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_gateway__pb2.UserWeatherReply.FromString,
+                )
+
+
+class GatewayServiceServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def GetDashboard(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUserWeather(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_GatewayServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetDashboard': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDashboard,
+                    request_deserializer=grpc__stubs_dot_gateway__pb2.DashboardRequest.FromString,
+                    response_serializer=grpc__stubs_dot_gateway__pb2.DashboardReply.SerializeToString,
+            ),
+            'GetUserWeather': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUserWeather,
+                    request_deserializer=grpc__stubs_dot_gateway__pb2.UserWeatherRequest.FromString,
+                    response_serializer=grpc__stubs_dot_gateway__pb2.UserWeatherReply.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'gateway.GatewayService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class GatewayService(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetDashboard(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/gateway.GatewayService/GetDashboard',
+            grpc__stubs_dot_gateway__pb2.DashboardRequest.SerializeToString,
+            grpc__stubs_dot_gateway__pb2.DashboardReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetUserWeather(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/gateway.GatewayService/GetUserWeather',
+            grpc__stubs_dot_gateway__pb2.UserWeatherRequest.SerializeToString,
+            grpc__stubs_dot_gateway__pb2.UserWeatherReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
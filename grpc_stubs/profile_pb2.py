@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grpc_stubs/profile.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18grpc_stubs/profile.proto\x12\x07profile\"M\n\x0eProfileRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x15\n\rknown_version\x18\x02 \x01(\x04\x12\x13\n\x0bknown_epoch\x18\x03 \x01(\x04\"\xbe\x01\n\x0cProfileReply\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0epreferred_city\x18\x03 \x01(\t\x12\x19\n\x11preferred_country\x18\x04 \x01(\t\x12\x0f\n\x07success\x18\x05 \x01(\x08\x12\x15\n\rerror_message\x18\x06 \x01(\t\x12\x0f\n\x07version\x18\x07 \x01(\x04\x12\x14\n\x0cnot_modified\x18\x08 \x01(\x08\x12\r\n\x05\x65poch\x18\t \x01(\x04\"H\n\x11UpdateCityRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12\x14\n\x0c\x63ountry_code\x18\x03 \x01(\t\"D\n\x0fUpdateCityReply\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\x04\"V\n\x14WatchProfilesRequest\x12\x15\n\rsince_version\x18\x01 \x01(\x04\x12\x18\n\x10start_at_current\x18\x02 \x01(\x08\x12\r\n\x05\x65poch\x18\x03 \x01(\x04\"r\n\rProfileRecord\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0epreferred_city\x18\x03 \x01(\t\x12\x19\n\x11preferred_country\x18\x04 \x01(\t\x12\x0f\n\x07version\x18\x05 \x01(\x04\"X\n\rProfileChange\x12\x0f\n\x07version\x18\x01 \x01(\x04\x12\'\n\x07profile\x18\x02 \x01(\x0b\x32\x16.profile.ProfileRecord\x12\r\n\x05\x65poch\x18\x03 \x01(\x04\"8\n\x0cProfileBatch\x12(\n\x08profiles\x18\x01 \x03(\x0b\x32\x16.profile.ProfileRecord\">\n\x0bRecordError\x12\r\n\x05index\x18\x01 \x01(\x04\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"\x80\x01\n\x13ImportProfilesReply\x12\x10\n\x08received\x18\x01 \x01(\x04\x12\x10\n\x08imported\x18\x02 \x01(\x04\x12\x0e\n\x06\x66\x61iled\x18\x03 \x01(\x04\x12$\n\x06\x65rrors\x18\x04 \x03(\x0b\x32\x14.profile.RecordError\x12\x0f\n\x07version\x18\x05 \x01(\x04\"J\n\x15\x45xportProfilesRequest\x12\x0f\n\x07\x63ountry\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12\x12\n\nbatch_size\x18\x03 \x01(\r2\xfa\x02\n\x0eProfileService\x12>\n\nGetProfile\x12\x17.profile.ProfileRequest\x1a\x15.profile.ProfileReply\"\x00\x12\x44\n\nUpdateCity\x12\x1a.profile.UpdateCityRequest\x1a\x18.profile.UpdateCityReply\"\x00\x12J\n\rWatchProfiles\x12\x1d.profile.WatchProfilesRequest\x1a\x16.profile.ProfileChange\"\x00\x30\x01\x12I\n\x0eImportProfiles\x12\x15.profile.ProfileBatch\x1a\x1c.profile.ImportProfilesReply\"\x00(\x01\x12K\n\x0e\x45xportProfiles\x12\x1e.profile.ExportProfilesRequest\x1a\x15.profile.ProfileBatch\"\x00\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_stubs.profile_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _globals['_PROFILEREQUEST']._serialized_start=37
+  _globals['_PROFILEREQUEST']._serialized_end=114
+  _globals['_PROFILEREPLY']._serialized_start=117
+  _globals['_PROFILEREPLY']._serialized_end=307
+  _globals['_UPDATECITYREQUEST']._serialized_start=309
+  _globals['_UPDATECITYREQUEST']._serialized_end=381
+  _globals['_UPDATECITYREPLY']._serialized_start=383
+  _globals['_UPDATECITYREPLY']._serialized_end=451
+  _globals['_WATCHPROFILESREQUEST']._serialized_start=453
+  _globals['_WATCHPROFILESREQUEST']._serialized_end=539
+  _globals['_PROFILERECORD']._serialized_start=541
+  _globals['_PROFILERECORD']._serialized_end=655
+  _globals['_PROFILECHANGE']._serialized_start=657
+  _globals['_PROFILECHANGE']._serialized_end=745
+  _globals['_PROFILEBATCH']._serialized_start=747
+  _globals['_PROFILEBATCH']._serialized_end=803
+  _globals['_RECORDERROR']._serialized_start=805
+  _globals['_RECORDERROR']._serialized_end=867
+  _globals['_IMPORTPROFILESREPLY']._serialized_start=870
+  _globals['_IMPORTPROFILESREPLY']._serialized_end=998
+  _globals['_EXPORTPROFILESREQUEST']._serialized_start=1000
+  _globals['_EXPORTPROFILESREQUEST']._serialized_end=1074
+  _globals['_PROFILESERVICE']._serialized_start=1077
+  _globals['_PROFILESERVICE']._serialized_end=1455
+# @@protoc_insertion_point(module_scope)
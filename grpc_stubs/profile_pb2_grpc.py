@@ -0,0 +1,198 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from grpc_stubs import profile_pb2 as grpc__stubs_dot_profile__pb2
+
+
+class ProfileServiceStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetProfile = channel.unary_unary(
+                '/profile.ProfileService/GetProfile',
+                request_serializer=grpc__stubs_dot_profile__pb2.ProfileRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_profile__pb2.ProfileReply.FromString,
+                )
+        self.UpdateCity = channel.unary_unary(
+                '/profile.ProfileService/UpdateCity',
+                request_serializer=grpc__stubs_dot_profile__pb2.UpdateCityRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_profile__pb2.UpdateCityReply.FromString,
+                )
+        self.WatchProfiles = channel.unary_stream(
+                '/profile.ProfileService/WatchProfiles',
+                request_serializer=grpc__stubs_dot_profile__pb2.WatchProfilesRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_profile__pb2.ProfileChange.FromString,
+                )
+        self.ImportProfiles = channel.stream_unary(
+                '/profile.ProfileService/ImportProfiles',
+                request_serializer=grpc__stubs_dot_profile__pb2.ProfileBatch.SerializeToString,
+                response_deserializer=grpc__stubs_dot_profile__pb2.ImportProfilesReply.FromString,
+                )
+        self.ExportProfiles = channel.unary_stream(
+                '/profile.ProfileService/ExportProfiles',
+                request_serializer=grpc__stubs_dot_profile__pb2.ExportProfilesRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_profile__pb2.ProfileBatch.FromString,
+                )
+
+
+class ProfileServiceServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def GetProfile(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateCity(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchProfiles(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ImportProfiles(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ExportProfiles(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ProfileServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetProfile': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetProfile,
+                    request_deserializer=grpc__stubs_dot_profile__pb2.ProfileRequest.FromString,
+                    response_serializer=grpc__stubs_dot_profile__pb2.ProfileReply.SerializeToString,
+            ),
+            'UpdateCity': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateCity,
+                    request_deserializer=grpc__stubs_dot_profile__pb2.UpdateCityRequest.FromString,
+                    response_serializer=grpc__stubs_dot_profile__pb2.UpdateCityReply.SerializeToString,
+            ),
+            'WatchProfiles': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchProfiles,
+                    request_deserializer=grpc__stubs_dot_profile__pb2.WatchProfilesRequest.FromString,
+                    response_serializer=grpc__stubs_dot_profile__pb2.ProfileChange.SerializeToString,
+            ),
+            'ImportProfiles': grpc.stream_unary_rpc_method_handler(
+                    servicer.ImportProfiles,
+                    request_deserializer=grpc__stubs_dot_profile__pb2.ProfileBatch.FromString,
+                    response_serializer=grpc__stubs_dot_profile__pb2.ImportProfilesReply.SerializeToString,
+            ),
+            'ExportProfiles': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExportProfiles,
+                    request_deserializer=grpc__stubs_dot_profile__pb2.ExportProfilesRequest.FromString,
+                    response_serializer=grpc__stubs_dot_profile__pb2.ProfileBatch.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'profile.ProfileService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ProfileService(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetProfile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/profile.ProfileService/GetProfile',
+            grpc__stubs_dot_profile__pb2.ProfileRequest.SerializeToString,
+            grpc__stubs_dot_profile__pb2.ProfileReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def UpdateCity(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/profile.ProfileService/UpdateCity',
+            grpc__stubs_dot_profile__pb2.UpdateCityRequest.SerializeToString,
+            grpc__stubs_dot_profile__pb2.UpdateCityReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def WatchProfiles(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/profile.ProfileService/WatchProfiles',
+            grpc__stubs_dot_profile__pb2.WatchProfilesRequest.SerializeToString,
+            grpc__stubs_dot_profile__pb2.ProfileChange.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ImportProfiles(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/profile.ProfileService/ImportProfiles',
+            grpc__stubs_dot_profile__pb2.ProfileBatch.SerializeToString,
+            grpc__stubs_dot_profile__pb2.ImportProfilesReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ExportProfiles(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/profile.ProfileService/ExportProfiles',
+            grpc__stubs_dot_profile__pb2.ExportProfilesRequest.SerializeToString,
+            grpc__stubs_dot_profile__pb2.ProfileBatch.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
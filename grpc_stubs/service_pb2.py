@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grpc_stubs/service.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18grpc_stubs/service.proto\x12\x07service\"\x1c\n\x0cHelloRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x1d\n\nHelloReply\x12\x0f\n\x07message\x18\x01 \x01(\t2H\n\x0cHelloService\x12\x38\n\x08SayHello\x12\x15.service.HelloRequest\x1a\x13.service.HelloReply\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_stubs.service_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _globals['_HELLOREQUEST']._serialized_start=37
+  _globals['_HELLOREQUEST']._serialized_end=65
+  _globals['_HELLOREPLY']._serialized_start=67
+  _globals['_HELLOREPLY']._serialized_end=96
+  _globals['_HELLOSERVICE']._serialized_start=98
+  _globals['_HELLOSERVICE']._serialized_end=170
+# @@protoc_insertion_point(module_scope)
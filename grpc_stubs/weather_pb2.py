@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grpc_stubs/weather.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18grpc_stubs/weather.proto\x12\x07weather\"4\n\x0eWeatherRequest\x12\x0c\n\x04\x63ity\x18\x01 \x01(\t\x12\x14\n\x0c\x63ountry_code\x18\x02 \x01(\t\"\xad\x01\n\x0cWeatherReply\x12\x0c\n\x04\x63ity\x18\x01 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x02 \x01(\t\x12\x1b\n\x13temperature_celsius\x18\x03 \x01(\x01\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x10\n\x08humidity\x18\x05 \x01(\x01\x12\x12\n\nwind_speed\x18\x06 \x01(\x01\x12\x0f\n\x07success\x18\x07 \x01(\x08\x12\x15\n\rerror_message\x18\x08 \x01(\t\"s\n\x17\x41ggregateWeatherRequest\x12*\n\tlocations\x18\x01 \x03(\x0b\x32\x17.weather.WeatherRequest\x12\x17\n\x0fprofile_country\x18\x02 \x01(\t\x12\x13\n\x0bpercentiles\x18\x03 \x03(\x01\"H\n\x15TemperaturePercentile\x12\x12\n\npercentile\x18\x01 \x01(\x01\x12\x1b\n\x13temperature_celsius\x18\x02 \x01(\x01\"\x85\x01\n\x13\x43ountryWeatherStats\x12\x0f\n\x07\x63ountry\x18\x01 \x01(\t\x12\x0e\n\x06\x63ities\x18\x02 \x01(\r\x12\x1b\n\x13\x61verage_temperature\x18\x03 \x01(\x01\x12\x17\n\x0fmin_temperature\x18\x04 \x01(\x01\x12\x17\n\x0fmax_temperature\x18\x05 \x01(\x01\"\x85\x03\n\x15\x41ggregateWeatherReply\x12\x18\n\x10\x63ities_requested\x18\x01 \x01(\r\x12\x18\n\x10\x63ities_processed\x18\x02 \x01(\r\x12\x1b\n\x13\x61verage_temperature\x18\x03 \x01(\x01\x12\x17\n\x0fmin_temperature\x18\x04 \x01(\x01\x12\x17\n\x0fmax_temperature\x18\x05 \x01(\x01\x12\x14\n\x0chottest_city\x18\x06 \x01(\t\x12\x14\n\x0c\x63oldest_city\x18\x07 \x01(\t\x12\x18\n\x10\x61verage_humidity\x18\x08 \x01(\x01\x12\x33\n\x0bpercentiles\x18\t \x03(\x0b\x32\x1e.weather.TemperaturePercentile\x12/\n\tcountries\x18\n \x03(\x0b\x32\x1c.weather.CountryWeatherStats\x12\x15\n\rfailed_cities\x18\x0b \x03(\t\x12\x0f\n\x07success\x18\x0c \x01(\x08\x12\x15\n\rerror_message\x18\r \x01(\t2\xa8\x01\n\x0eWeatherService\x12>\n\nGetWeather\x12\x17.weather.WeatherRequest\x1a\x15.weather.WeatherReply\"\x00\x12V\n\x10\x41ggregateWeather\x12 .weather.AggregateWeatherRequest\x1a\x1e.weather.AggregateWeatherReply\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_stubs.weather_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _globals['_WEATHERREQUEST']._serialized_start=37
+  _globals['_WEATHERREQUEST']._serialized_end=89
+  _globals['_WEATHERREPLY']._serialized_start=92
+  _globals['_WEATHERREPLY']._serialized_end=265
+  _globals['_AGGREGATEWEATHERREQUEST']._serialized_start=267
+  _globals['_AGGREGATEWEATHERREQUEST']._serialized_end=382
+  _globals['_TEMPERATUREPERCENTILE']._serialized_start=384
+  _globals['_TEMPERATUREPERCENTILE']._serialized_end=456
+  _globals['_COUNTRYWEATHERSTATS']._serialized_start=459
+  _globals['_COUNTRYWEATHERSTATS']._serialized_end=592
+  _globals['_AGGREGATEWEATHERREPLY']._serialized_start=595
+  _globals['_AGGREGATEWEATHERREPLY']._serialized_end=984
+  _globals['_WEATHERSERVICE']._serialized_start=987
+  _globals['_WEATHERSERVICE']._serialized_end=1155
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,99 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from grpc_stubs import weather_pb2 as grpc__stubs_dot_weather__pb2
+
+
+class WeatherServiceStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetWeather = channel.unary_unary(
+                '/weather.WeatherService/GetWeather',
+                request_serializer=grpc__stubs_dot_weather__pb2.WeatherRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_weather__pb2.WeatherReply.FromString,
+                )
+        self.AggregateWeather = channel.unary_unary(
+                '/weather.WeatherService/AggregateWeather',
+                request_serializer=grpc__stubs_dot_weather__pb2.AggregateWeatherRequest.SerializeToString,
+                response_deserializer=grpc__stubs_dot_weather__pb2.AggregateWeatherReply.FromString,
+                )
+
+
+class WeatherServiceServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def GetWeather(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AggregateWeather(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_WeatherServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetWeather': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetWeather,
+                    request_deserializer=grpc__stubs_dot_weather__pb2.WeatherRequest.FromString,
+                    response_serializer=grpc__stubs_dot_weather__pb2.WeatherReply.SerializeToString,
+            ),
+            'AggregateWeather': grpc.unary_unary_rpc_method_handler(
+                    servicer.AggregateWeather,
+                    request_deserializer=grpc__stubs_dot_weather__pb2.AggregateWeatherRequest.FromString,
+                    response_serializer=grpc__stubs_dot_weather__pb2.AggregateWeatherReply.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'weather.WeatherService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class WeatherService(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetWeather(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/weather.WeatherService/GetWeather',
+            grpc__stubs_dot_weather__pb2.WeatherRequest.SerializeToString,
+            grpc__stubs_dot_weather__pb2.WeatherReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def AggregateWeather(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/weather.WeatherService/AggregateWeather',
+            grpc__stubs_dot_weather__pb2.AggregateWeatherRequest.SerializeToString,
+            grpc__stubs_dot_weather__pb2.AggregateWeatherReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
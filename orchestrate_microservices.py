@@ -11,11 +11,11 @@ from datetime import datetime
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import all gRPC modules
-import service_pb2, service_pb2_grpc
-import weather_pb2, weather_pb2_grpc
-import profile_pb2, profile_pb2_grpc
-import gateway_pb2, gateway_pb2_grpc
+from grpc_common import transport
+from grpc_common.scheduler import priority_metadata
+
+# gRPC stub modules are imported inside each command so a command only pays
+# for the stubs it actually uses
 
 
 class MicroserviceOrchestrator:
@@ -23,24 +23,23 @@ class MicroserviceOrchestrator:
     
     def __init__(self):
         self.services = {
-            'hello': 'localhost:50051',
-            'weather': 'localhost:50052', 
-            'profile': 'localhost:50053',
-            'gateway': 'localhost:50054'
+            name: transport.target(name)
+            for name in ('hello', 'weather', 'profile', 'gateway')
         }
     
-    def get_complete_user_dashboard(self, user_id):
+    def get_complete_user_dashboard(self, user_id, priority='interactive'):
         """
         🎯 COMMAND: Connect ALL microservices for complete user dashboard
         This calls: Gateway -> Profile -> Weather -> Hello services
         """
+        from grpc_stubs import gateway_pb2, gateway_pb2_grpc
         print(f"🔗 Orchestrating ALL microservices for user: {user_id}")
         
         try:
             with grpc.insecure_channel(self.services['gateway']) as channel:
                 stub = gateway_pb2_grpc.GatewayServiceStub(channel)
                 request = gateway_pb2.DashboardRequest(user_id=user_id)
-                response = stub.GetDashboard(request, timeout=20)
+                response = stub.GetDashboard(request, timeout=20, metadata=priority_metadata(priority))
                 
                 if response.success:
                     return {
@@ -76,7 +75,7 @@ class MicroserviceOrchestrator:
         
         results = []
         for user_id in user_ids:
-            result = self.get_complete_user_dashboard(user_id)
+            result = self.get_complete_user_dashboard(user_id, priority='batch')
             if "error" not in result:
                 results.append({
                     "user": user_id,
@@ -93,45 +92,50 @@ class MicroserviceOrchestrator:
             "🏗️ microservices_used": ["Gateway", "Profile", "Weather", "Hello"]
         }
     
-    def get_weather_aggregation(self, cities):
+    def get_weather_aggregation(self, cities, profile_country=""):
         """
         🎯 COMMAND: Aggregate weather from multiple cities
+        Statistics are computed by the Weather service; only the summary is returned
         """
+        from grpc_stubs import weather_pb2, weather_pb2_grpc
         print(f"🔗 Weather aggregation for cities: {', '.join(cities)}")
         
-        weather_data = []
-        
-        with grpc.insecure_channel(self.services['weather']) as channel:
-            stub = weather_pb2_grpc.WeatherServiceStub(channel)
-            
-            for city in cities:
-                try:
-                    request = weather_pb2.WeatherRequest(city=city)
-                    response = stub.GetWeather(request, timeout=10)
-                    
-                    if response.success:
-                        weather_data.append({
-                            "city": response.city,
-                            "country": response.country,
-                            "temperature": response.temperature_celsius,
-                            "condition": response.description,
-                            "humidity": response.humidity
-                        })
-                except Exception as e:
-                    weather_data.append({"city": city, "error": str(e)})
+        try:
+            with grpc.insecure_channel(self.services['weather']) as channel:
+                stub = weather_pb2_grpc.WeatherServiceStub(channel)
+                request = weather_pb2.AggregateWeatherRequest(
+                    locations=[weather_pb2.WeatherRequest(city=city) for city in cities],
+                    profile_country=profile_country
+                )
+                response = stub.AggregateWeather(request, timeout=30, metadata=priority_metadata('batch'))
+        except Exception as e:
+            return {"error": str(e), "unified_output": "CONNECTION_FAILED"}
         
-        # Calculate aggregations
-        temps = [w["temperature"] for w in weather_data if "temperature" in w]
+        if not response.success:
+            return {"error": response.error_message, "unified_output": "FAILED",
+                    "failed_cities": list(response.failed_cities)}
         
         return {
             "🎯 unified_output": "WEATHER_AGGREGATION_SUCCESS",
-            "🌍 cities_data": weather_data,
             "📊 aggregation": {
-                "cities_processed": len(weather_data),
-                "average_temperature": round(sum(temps) / len(temps), 1) if temps else 0,
-                "hottest_city": max(weather_data, key=lambda x: x.get("temperature", -999))["city"] if temps else None,
-                "coldest_city": min(weather_data, key=lambda x: x.get("temperature", 999))["city"] if temps else None
-            }
+                "cities_processed": response.cities_processed,
+                "average_temperature": round(response.average_temperature, 1),
+                "hottest_city": response.hottest_city,
+                "coldest_city": response.coldest_city,
+                "temperature_percentiles": {
+                    f"p{p.percentile:g}": round(p.temperature_celsius, 1) for p in response.percentiles
+                },
+                "by_country": {
+                    c.country: {
+                        "cities": c.cities,
+                        "average_temperature": round(c.average_temperature, 1),
+                        "min_temperature": c.min_temperature,
+                        "max_temperature": c.max_temperature
+                    }
+                    for c in response.countries
+                }
+            },
+            "❌ failed_cities": list(response.failed_cities)
         }
 
 
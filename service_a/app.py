@@ -8,8 +8,8 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import service_pb2
-import service_pb2_grpc
+from grpc_common import transport
+from grpc_stubs import service_pb2, service_pb2_grpc
 
 
 def call_hello_service(name):
@@ -17,7 +17,7 @@ def call_hello_service(name):
     print(f"[ServiceA] Calling Hello Service for: {name}")
     
     try:
-        with grpc.insecure_channel('localhost:50051') as channel:
+        with grpc.insecure_channel(transport.target('hello')) as channel:
             stub = service_pb2_grpc.HelloServiceStub(channel)
             request = service_pb2.HelloRequest(name=name)
             response = stub.SayHello(request, timeout=5)
@@ -1,12 +1,11 @@
-from concurrent import futures
-import grpc
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import service_pb2
-import service_pb2_grpc
+from grpc_common import transport
+from grpc_common.server import create_server
+from grpc_stubs import service_pb2, service_pb2_grpc
 
 
 class HelloServicer(service_pb2_grpc.HelloServiceServicer):
@@ -17,18 +16,14 @@ class HelloServicer(service_pb2_grpc.HelloServiceServicer):
 
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = create_server('hello')
     service_pb2_grpc.add_HelloServiceServicer_to_server(HelloServicer(), server)
-    server.add_insecure_port('[::]:50051')
+    addresses = transport.add_listen_ports(server, 'hello')
     server.start()
-    print("🚀 Hello gRPC Server started on port 50051")
-    print("Press Ctrl+C to stop...")
+    print(f"🚀 Hello gRPC Server started on {', '.join(addresses)}")
+    print("Press Ctrl+C or send SIGTERM to stop gracefully...")
     
-    try:
-        server.wait_for_termination()
-    except KeyboardInterrupt:
-        print("\n⏹️  Server stopped.")
-        server.stop(0)
+    server.graceful_shutdown.wait()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,153 @@
+"""
+Gateway-side profile cache kept coherent by ProfileService.WatchProfiles
+
+While the watch stream is connected and caught up, cached profiles are served
+without contacting the Profile service at all. When the stream is down, a
+cached entry is revalidated with a conditional GetProfile (known_version),
+which returns a small not_modified reply if nothing changed.
+
+Versions are only comparable within one Profile store epoch. A watch that
+comes back with a different epoch (the Profile service restarted) drops every
+cached entry, and revalidation sends the cached epoch along with its version.
+"""
+from collections import OrderedDict
+import threading
+
+import grpc
+
+from grpc_common import faults, transport
+from grpc_common.metrics import REGISTRY
+from grpc_stubs import profile_pb2, profile_pb2_grpc
+
+
+class ProfileCache:
+    def __init__(self, max_entries=10000, reconnect_seconds=2.0):
+        self.max_entries = max_entries
+        self.reconnect_seconds = reconnect_seconds
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._live = False
+        self._version = 0
+        self._epoch = 0
+        self._stopped = threading.Event()
+        self._channel = None
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._watch, name="profile-cache-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        with self._lock:
+            self._live = False
+            channel = self._channel
+        if channel is not None:
+            channel.close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_profile(self, stub, user_id, timeout, metadata=None):
+        """Return a ProfileReply, from cache when it is known to be current"""
+        key = user_id.lower()
+        with self._lock:
+            watched = (self._epoch, self._version)
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                if self._live:
+                    REGISTRY.increment("profile_cache.hits")
+                    return cached
+
+        request = profile_pb2.ProfileRequest(
+            user_id=user_id,
+            known_version=cached.version if cached is not None else 0,
+            known_epoch=cached.epoch if cached is not None else 0
+        )
+        reply = stub.GetProfile(request, timeout=timeout, metadata=metadata)
+
+        if reply.not_modified and cached is not None:
+            REGISTRY.increment("profile_cache.not_modified")
+            return cached
+
+        REGISTRY.increment("profile_cache.misses")
+        if reply.success:
+            self._store(key, reply, watched)
+        return reply
+
+    def _store(self, key, reply, watched):
+        with self._lock:
+            # A change streamed while we were fetching may be newer than this reply
+            if (self._epoch, self._version) != watched:
+                return
+            current = self._entries.get(key)
+            if current is not None and current.epoch == reply.epoch and current.version >= reply.version:
+                return
+            self._entries[key] = reply
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _apply(self, change):
+        record = change.profile
+        key = record.user_id.lower()
+        with self._lock:
+            self._version = change.version
+            current = self._entries.get(key)
+            # Only refresh users we already cache; others are fetched on demand
+            if current is None or (current.epoch == change.epoch and current.version >= change.version):
+                return
+            self._entries[key] = profile_pb2.ProfileReply(
+                user_id=current.user_id,
+                name=record.name,
+                preferred_city=record.preferred_city,
+                preferred_country=record.preferred_country,
+                success=True,
+                version=change.version,
+                epoch=change.epoch
+            )
+
+    def _watch(self):
+        while not self._stopped.is_set():
+            resuming = self._version != 0
+            try:
+                with faults.intercept_channel(grpc.insecure_channel(transport.target('profile'))) as channel:
+                    with self._lock:
+                        self._channel = channel
+                    stub = profile_pb2_grpc.ProfileServiceStub(channel)
+                    request = profile_pb2.WatchProfilesRequest(
+                        since_version=self._version,
+                        start_at_current=not resuming,
+                        epoch=self._epoch
+                    )
+                    for change in stub.WatchProfiles(request):
+                        if change.HasField('profile'):
+                            self._apply(change)
+                            continue
+
+                        with self._lock:
+                            # Entries fetched before a fresh watch, or from a restarted
+                            # store (new epoch), cannot be proven current
+                            if not resuming or change.epoch != self._epoch:
+                                self._entries.clear()
+                            self._epoch = change.epoch
+                            self._version = change.version
+                            self._live = True
+            except grpc.RpcError as e:
+                if not self._stopped.is_set():
+                    print(f"[GatewayService] Profile watch disconnected: {e.code()}")
+            except Exception as e:
+                # Anything else (a closed channel, a bad fault rule) must not end
+                # the thread for good: log it and reconnect like a disconnect
+                if not self._stopped.is_set():
+                    print(f"[GatewayService] ❌ Profile watch failed: {e}")
+            finally:
+                with self._lock:
+                    self._live = False
+                    self._channel = None
+            self._stopped.wait(self.reconnect_seconds)
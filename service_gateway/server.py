@@ -1,39 +1,105 @@
-from concurrent import futures
 import grpc
+import math
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import service_pb2
-import service_pb2_grpc
-import weather_pb2
-import weather_pb2_grpc
-import profile_pb2
-import profile_pb2_grpc
-import gateway_pb2
-import gateway_pb2_grpc
+from grpc_common import faults, transport
+from grpc_common.server import create_server
+from grpc_common.rate_limit import RateLimiter
+from grpc_common.scheduler import PRIORITY_METADATA_KEY, priority_metadata
+from profile_cache import ProfileCache
+from grpc_stubs import service_pb2, service_pb2_grpc
+from grpc_stubs import weather_pb2, weather_pb2_grpc
+from grpc_stubs import profile_pb2_grpc
+from grpc_stubs import gateway_pb2, gateway_pb2_grpc
+
+
+# Rate limits (requests/second and burst size), overridable via environment
+USER_RATE = float(os.environ.get('GATEWAY_USER_RATE', '5'))
+USER_BURST = float(os.environ.get('GATEWAY_USER_BURST', '10'))
+CLIENT_RATE = float(os.environ.get('GATEWAY_CLIENT_RATE', '50'))
+CLIENT_BURST = float(os.environ.get('GATEWAY_CLIENT_BURST', '100'))
+
+
+def caller_identity(context):
+    """Identify the caller by x-client-id metadata, falling back to its peer address"""
+    for key, value in context.invocation_metadata():
+        if key == 'x-client-id' and value:
+            return f"id:{value}"
+
+    peer = context.peer() or "unknown"
+    if peer.startswith(('ipv4:', 'ipv6:')):
+        # Drop the ephemeral port so every connection from a host shares a bucket
+        peer = peer.rsplit(':', 1)[0]
+    return f"peer:{peer}"
+
+
+def downstream_metadata(context):
+    """Forward the caller's priority class to downstream services"""
+    for key, value in context.invocation_metadata():
+        if key == PRIORITY_METADATA_KEY:
+            return ((key, value),)
+    return priority_metadata('interactive')
+
+
+def fill_weather_info(weather_info, weather_resp):
+    """Copy a WeatherReply into a reply's WeatherInfo sub-message in place"""
+    weather_info.city = weather_resp.city
+    weather_info.country = weather_resp.country
+    weather_info.temperature_celsius = weather_resp.temperature_celsius
+    weather_info.description = weather_resp.description
+    weather_info.humidity = weather_resp.humidity
+    weather_info.wind_speed = weather_resp.wind_speed
 
 
 class GatewayServicer(gateway_pb2_grpc.GatewayServiceServicer):
+    def __init__(self, profile_cache):
+        self.profile_cache = profile_cache
+        self.user_limiter = RateLimiter(USER_RATE, USER_BURST)
+        self.client_limiter = RateLimiter(CLIENT_RATE, CLIENT_BURST)
+
+    def _enforce_rate_limit(self, user_id, context):
+        """Abort with RESOURCE_EXHAUSTED and retry-after metadata when over limit"""
+        client = caller_identity(context)
+        retry_after = self.client_limiter.acquire(client)
+        limited = f"client {client}"
+        if not retry_after:
+            retry_after = self.user_limiter.acquire(user_id.lower())
+            limited = f"user '{user_id}'"
+            if retry_after:
+                # A throttled user must not spend the caller's budget for other users
+                self.client_limiter.refund(client)
+        if not retry_after:
+            return
+
+        print(f"[GatewayService] ⛔ Rate limited {limited}, retry after {retry_after:.2f}s")
+        context.set_trailing_metadata((
+            ('retry-after', str(math.ceil(retry_after))),
+            ('retry-after-ms', str(math.ceil(retry_after * 1000))),
+        ))
+        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f"Rate limit exceeded for {limited}")
+
     def GetDashboard(self, request, context):
         user_id = request.user_id
+        self._enforce_rate_limit(user_id, context)
         
         print(f"[GatewayService] Building dashboard for: {user_id}")
+        metadata = downstream_metadata(context)
         
         try:
             # Get greeting from Hello service
-            with grpc.insecure_channel('localhost:50051') as channel:
+            with faults.intercept_channel(grpc.insecure_channel(transport.target('hello'))) as channel:
                 stub = service_pb2_grpc.HelloServiceStub(channel)
                 hello_req = service_pb2.HelloRequest(name=user_id)
-                hello_resp = stub.SayHello(hello_req, timeout=5)
+                hello_resp = stub.SayHello(hello_req, timeout=5, metadata=metadata)
                 greeting = hello_resp.message
             
             # Get user profile
-            with grpc.insecure_channel('localhost:50053') as channel:
+            with faults.intercept_channel(grpc.insecure_channel(transport.target('profile'))) as channel:
                 stub = profile_pb2_grpc.ProfileServiceStub(channel)
-                profile_req = profile_pb2.ProfileRequest(user_id=user_id)
-                profile_resp = stub.GetProfile(profile_req, timeout=5)
+                profile_resp = self.profile_cache.get_profile(stub, user_id, timeout=5, metadata=metadata)
                 
                 if not profile_resp.success:
                     return gateway_pb2.DashboardReply(
@@ -42,40 +108,26 @@ class GatewayServicer(gateway_pb2_grpc.GatewayServiceServicer):
                     )
             
             # Get weather for user's preferred city
-            with grpc.insecure_channel('localhost:50052') as channel:
+            with faults.intercept_channel(grpc.insecure_channel(transport.target('weather'))) as channel:
                 stub = weather_pb2_grpc.WeatherServiceStub(channel)
                 weather_req = weather_pb2.WeatherRequest(
                     city=profile_resp.preferred_city,
                     country_code=profile_resp.preferred_country
                 )
-                weather_resp = stub.GetWeather(weather_req, timeout=15)
+                weather_resp = stub.GetWeather(weather_req, timeout=15, metadata=metadata)
             
-            # Build response
-            user_info = gateway_pb2.UserInfo(
-                user_id=profile_resp.user_id,
-                name=profile_resp.name,
-                preferred_city=profile_resp.preferred_city,
-                preferred_country=profile_resp.preferred_country
-            )
-            
-            weather_info = gateway_pb2.WeatherInfo(
-                city=weather_resp.city,
-                country=weather_resp.country,
-                temperature_celsius=weather_resp.temperature_celsius,
-                description=weather_resp.description,
-                humidity=weather_resp.humidity,
-                wind_speed=weather_resp.wind_speed
-            )
+            # Build response in place (see benchmarks/protobuf_benchmark.py)
+            reply = gateway_pb2.DashboardReply(greeting=greeting, success=True)
+            user_info = reply.user_info
+            user_info.user_id = profile_resp.user_id
+            user_info.name = profile_resp.name
+            user_info.preferred_city = profile_resp.preferred_city
+            user_info.preferred_country = profile_resp.preferred_country
+            fill_weather_info(reply.weather_info, weather_resp)
             
             print(f"[GatewayService] ✅ Dashboard complete for {user_id}")
             
-            return gateway_pb2.DashboardReply(
-                greeting=greeting,
-                user_info=user_info,
-                weather_info=weather_info,
-                success=True,
-                error_message=""
-            )
+            return reply
             
         except Exception as e:
             print(f"[GatewayService] ❌ Error building dashboard: {str(e)}")
@@ -86,15 +138,16 @@ class GatewayServicer(gateway_pb2_grpc.GatewayServiceServicer):
     
     def GetUserWeather(self, request, context):
         user_id = request.user_id
+        self._enforce_rate_limit(user_id, context)
         
         print(f"[GatewayService] Getting weather for user: {user_id}")
+        metadata = downstream_metadata(context)
         
         try:
             # Get user profile first
-            with grpc.insecure_channel('localhost:50053') as channel:
+            with faults.intercept_channel(grpc.insecure_channel(transport.target('profile'))) as channel:
                 stub = profile_pb2_grpc.ProfileServiceStub(channel)
-                profile_req = profile_pb2.ProfileRequest(user_id=user_id)
-                profile_resp = stub.GetProfile(profile_req, timeout=5)
+                profile_resp = self.profile_cache.get_profile(stub, user_id, timeout=5, metadata=metadata)
                 
                 if not profile_resp.success:
                     return gateway_pb2.UserWeatherReply(
@@ -103,32 +156,24 @@ class GatewayServicer(gateway_pb2_grpc.GatewayServiceServicer):
                     )
             
             # Get weather for user's preferred city
-            with grpc.insecure_channel('localhost:50052') as channel:
+            with faults.intercept_channel(grpc.insecure_channel(transport.target('weather'))) as channel:
                 stub = weather_pb2_grpc.WeatherServiceStub(channel)
                 weather_req = weather_pb2.WeatherRequest(
                     city=profile_resp.preferred_city,
                     country_code=profile_resp.preferred_country
                 )
-                weather_resp = stub.GetWeather(weather_req, timeout=15)
+                weather_resp = stub.GetWeather(weather_req, timeout=15, metadata=metadata)
             
-            weather_info = gateway_pb2.WeatherInfo(
-                city=weather_resp.city,
-                country=weather_resp.country,
-                temperature_celsius=weather_resp.temperature_celsius,
-                description=weather_resp.description,
-                humidity=weather_resp.humidity,
-                wind_speed=weather_resp.wind_speed
+            reply = gateway_pb2.UserWeatherReply(
+                user_id=user_id,
+                city=profile_resp.preferred_city,
+                success=True
             )
+            fill_weather_info(reply.weather_info, weather_resp)
             
             print(f"[GatewayService] ✅ User weather complete for {user_id}")
             
-            return gateway_pb2.UserWeatherReply(
-                user_id=user_id,
-                city=profile_resp.preferred_city,
-                weather_info=weather_info,
-                success=True,
-                error_message=""
-            )
+            return reply
             
         except Exception as e:
             print(f"[GatewayService] ❌ Error getting user weather: {str(e)}")
@@ -139,21 +184,20 @@ class GatewayServicer(gateway_pb2_grpc.GatewayServiceServicer):
 
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    gateway_pb2_grpc.add_GatewayServiceServicer_to_server(GatewayServicer(), server)
-    server.add_insecure_port('[::]:50054')
+    server = create_server('gateway')
+    profile_cache = ProfileCache()
+    profile_cache.start()
+    gateway_pb2_grpc.add_GatewayServiceServicer_to_server(GatewayServicer(profile_cache), server)
+    server.graceful_shutdown.add_exit_hook(profile_cache.stop)
+    addresses = transport.add_listen_ports(server, 'gateway')
     server.start()
-    print("🚀 Gateway gRPC Server started on port 50054")
+    print(f"🚀 Gateway gRPC Server started on {', '.join(addresses)}")
     print("Available services:")
     print("  - GetDashboard: Complete user dashboard")
     print("  - GetUserWeather: User's weather info")
-    print("Press Ctrl+C to stop...")
+    print("Press Ctrl+C or send SIGTERM to stop gracefully...")
     
-    try:
-        server.wait_for_termination()
-    except KeyboardInterrupt:
-        print("\n⏹️  Server stopped.")
-        server.stop(0)
+    server.graceful_shutdown.wait()
 
 
 if __name__ == '__main__':
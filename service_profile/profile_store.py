@@ -0,0 +1,150 @@
+"""
+Versioned in-memory profile store
+
+Every change gets the next value of a store-wide, monotonically increasing
+version, and each profile remembers the version of its last change. Versions
+restart with the process, so each store also draws a random epoch: a
+(epoch, version) pair identifies a state, and a version from another epoch
+says nothing about the current one. Records
+are replaced (never mutated) on update so readers can use them without
+holding the lock. A bounded change log lets watchers catch up from any
+version; once a version has fallen out of the log, catching up falls back to
+scanning the current profiles, which yields the same final state.
+
+Secondary indexes by country and by city are maintained incrementally on
+every write, so filtered exports never scan the whole store.
+"""
+from collections import deque
+import random
+import threading
+
+
+class ProfileRecord:
+    __slots__ = ('user_id', 'name', 'preferred_city', 'preferred_country', 'version')
+
+    def __init__(self, user_id, name, preferred_city, preferred_country, version):
+        self.user_id = user_id
+        self.name = name
+        self.preferred_city = preferred_city
+        self.preferred_country = preferred_country
+        self.version = version
+
+
+class ProfileStore:
+    def __init__(self, initial_profiles=None, change_log_size=100000):
+        self.epoch = random.SystemRandom().randrange(1, 2 ** 64)
+        self._condition = threading.Condition()
+        self._profiles = {}
+        self._version = 0
+        self._changes = deque(maxlen=change_log_size)
+        self._by_country = {}
+        self._by_city = {}
+
+        for user_id, data in (initial_profiles or {}).items():
+            self.upsert(user_id, data["name"], data["preferred_city"], data["preferred_country"])
+
+    @property
+    def version(self):
+        return self._version
+
+    def __len__(self):
+        return len(self._profiles)
+
+    def get(self, user_id):
+        return self._profiles.get(user_id.lower())
+
+    def upsert(self, user_id, name, preferred_city, preferred_country):
+        """Create or replace a profile and return its new version"""
+        with self._condition:
+            return self._apply(user_id.lower(), name, preferred_city, preferred_country)
+
+    def update_city(self, user_id, city, country):
+        """Change a user's preferred city; return the new record or None if unknown"""
+        user_id = user_id.lower()
+        with self._condition:
+            current = self._profiles.get(user_id)
+            if current is None:
+                return None
+            self._apply(user_id, current.name, city, country)
+            return self._profiles[user_id]
+
+    def import_batch(self, profiles):
+        """Apply (user_id, name, city, country) tuples as one transaction
+
+        Watchers are woken once per batch instead of once per record.
+        Returns the store version after the batch.
+        """
+        with self._condition:
+            for user_id, name, preferred_city, preferred_country in profiles:
+                self._apply(user_id.lower(), name, preferred_city, preferred_country, notify=False)
+            self._condition.notify_all()
+            return self._version
+
+    def export(self, country=None, city=None):
+        """Return a point-in-time list of records, optionally filtered"""
+        with self._condition:
+            if country is None and city is None:
+                return list(self._profiles.values())
+
+            candidates = None
+            if country is not None:
+                candidates = self._by_country.get(country.upper(), set())
+            if city is not None:
+                by_city = self._by_city.get(city.lower(), set())
+                candidates = by_city if candidates is None else candidates & by_city
+            return [self._profiles[user_id] for user_id in candidates]
+
+    def _apply(self, user_id, name, preferred_city, preferred_country, notify=True):
+        previous = self._profiles.get(user_id)
+        if previous is not None:
+            self._unindex(previous)
+
+        self._version += 1
+        record = ProfileRecord(user_id, name, preferred_city, preferred_country, self._version)
+        self._profiles[user_id] = record
+        self._index(record)
+        self._changes.append((self._version, user_id))
+        if notify:
+            self._condition.notify_all()
+        return self._version
+
+    def _index(self, record):
+        self._by_country.setdefault(record.preferred_country.upper(), set()).add(record.user_id)
+        self._by_city.setdefault(record.preferred_city.lower(), set()).add(record.user_id)
+
+    def _unindex(self, record):
+        for index, key in ((self._by_country, record.preferred_country.upper()),
+                           (self._by_city, record.preferred_city.lower())):
+            members = index.get(key)
+            if members is not None:
+                members.discard(record.user_id)
+                if not members:
+                    del index[key]
+
+    def changes_since(self, since_version):
+        """Return current records changed after `since_version`, oldest first"""
+        with self._condition:
+            if since_version >= self._version:
+                return []
+
+            if self._changes and self._changes[0][0] <= since_version + 1:
+                changed = []
+                for version, user_id in reversed(self._changes):
+                    if version <= since_version:
+                        break
+                    record = self._profiles[user_id]
+                    # Older log entries for a user are superseded by its latest change
+                    if record.version == version:
+                        changed.append(record)
+                changed.reverse()
+                return changed
+
+            # The log no longer reaches back that far: compact from current state
+            records = [record for record in self._profiles.values() if record.version > since_version]
+        records.sort(key=lambda record: record.version)
+        return records
+
+    def wait_for_change(self, since_version, timeout):
+        """Block until the store moves past `since_version` or `timeout` elapses"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._version > since_version, timeout)
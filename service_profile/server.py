@@ -1,14 +1,15 @@
-from concurrent import futures
-import grpc
 import sys
 import os
+import threading
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import profile_pb2
-import profile_pb2_grpc
+from grpc_common import transport
+from grpc_common.server import create_server
+from profile_store import ProfileStore
+from grpc_stubs import profile_pb2, profile_pb2_grpc
 
-# Simple in-memory user storage:
+# Seed profiles loaded into the versioned ProfileStore at startup:
 USERS_DB = {
     "puneeth": {"name": "Puneeth G M", "preferred_city": "Bengaluru", "preferred_country": "IN"},
     "ravi": {"name": "Ravi", "preferred_city": "Bengaluru", "preferred_country": "IN"},
@@ -18,30 +19,76 @@ USERS_DB = {
 }
 
 
+# Seconds a WatchProfiles stream waits for changes before re-checking the client
+WATCH_POLL_SECONDS = 1.0
+
+# Bulk import/export limits
+MAX_REPORTED_IMPORT_ERRORS = 1000
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+MAX_EXPORT_BATCH_SIZE = 10000
+
+
+def validate_record(record):
+    """Return an error message for an invalid imported profile, or None"""
+    if not record.user_id.strip():
+        return "user_id is required"
+    if len(record.user_id) > 64:
+        return "user_id must be at most 64 characters"
+    if not record.name.strip():
+        return "name is required"
+    if not record.preferred_city.strip():
+        return "preferred_city is required"
+    country = record.preferred_country
+    if len(country) != 2 or not country.isalpha():
+        return "preferred_country must be a 2-letter country code"
+    return None
+
+
 class ProfileServicer(profile_pb2_grpc.ProfileServiceServicer):
+    def __init__(self, store):
+        self.store = store
+        self._stopping = threading.Event()
+
+    def stop_watches(self):
+        """End every WatchProfiles stream within WATCH_POLL_SECONDS (used while draining)"""
+        self._stopping.set()
+
     def GetProfile(self, request, context):
         user_id = request.user_id.lower()
         
         print(f"[ProfileService] Getting profile for: {user_id}")
         
-        if user_id not in USERS_DB:
-            print(f"[ProfileService] ❌ User not found: {user_id}. Available: {list(USERS_DB.keys())}")
+        record = self.store.get(user_id)
+        if record is None:
+            print(f"[ProfileService] ❌ User not found: {user_id}. Known users: {len(self.store)}")
             return profile_pb2.ProfileReply(
                 user_id=request.user_id,
                 success=False,
                 error_message=f"User '{request.user_id}' not found"
             )
         
-        user_data = USERS_DB[user_id]
-        print(f"[ProfileService] ✅ Found user: {user_data['name']} from {user_data['preferred_city']}")
+        if (request.known_version and request.known_version == record.version
+                and request.known_epoch == self.store.epoch):
+            print(f"[ProfileService] ✅ Not modified: {user_id} @ v{record.version}")
+            return profile_pb2.ProfileReply(
+                user_id=request.user_id,
+                success=True,
+                version=record.version,
+                not_modified=True,
+                epoch=self.store.epoch
+            )
+        
+        print(f"[ProfileService] ✅ Found user: {record.name} from {record.preferred_city}")
         
         return profile_pb2.ProfileReply(
             user_id=request.user_id,
-            name=user_data["name"],
-            preferred_city=user_data["preferred_city"],
-            preferred_country=user_data["preferred_country"],
+            name=record.name,
+            preferred_city=record.preferred_city,
+            preferred_country=record.preferred_country,
             success=True,
-            error_message=""
+            error_message="",
+            version=record.version,
+            epoch=self.store.epoch
         )
     
     def UpdateCity(self, request, context):
@@ -49,35 +96,132 @@ class ProfileServicer(profile_pb2_grpc.ProfileServiceServicer):
         
         print(f"[ProfileService] Updating city for {user_id}: {request.city}, {request.country_code}")
         
-        if user_id not in USERS_DB:
+        record = self.store.update_city(user_id, request.city, request.country_code)
+        if record is None:
             return profile_pb2.UpdateCityReply(
                 success=False,
                 message=f"User '{request.user_id}' not found"
             )
         
-        USERS_DB[user_id]["preferred_city"] = request.city
-        USERS_DB[user_id]["preferred_country"] = request.country_code
-        
         return profile_pb2.UpdateCityReply(
             success=True,
-            message=f"Updated {request.user_id}'s preferred city to {request.city}"
+            message=f"Updated {request.user_id}'s preferred city to {request.city}",
+            version=record.version
         )
+    
+    def WatchProfiles(self, request, context):
+        epoch = self.store.epoch
+        resuming = request.since_version != 0
+        if request.start_at_current or (resuming and request.epoch != epoch):
+            # since_version from another epoch (e.g. before a restart) is meaningless;
+            # a replay from version 0 means the full feed in any epoch
+            version = self.store.version
+        else:
+            version = request.since_version
+        
+        print(f"[ProfileService] Watching profile changes since v{version}")
+        
+        caught_up = False
+        while context.is_active() and not self._stopping.is_set():
+            for record in self.store.changes_since(version):
+                yield profile_pb2.ProfileChange(
+                    version=record.version,
+                    epoch=epoch,
+                    profile=profile_pb2.ProfileRecord(
+                        user_id=record.user_id,
+                        name=record.name,
+                        preferred_city=record.preferred_city,
+                        preferred_country=record.preferred_country
+                    )
+                )
+                version = record.version
+            if not caught_up:
+                caught_up = True
+                # A different epoch than requested tells the caller to resync
+                yield profile_pb2.ProfileChange(version=version, epoch=epoch)
+            self.store.wait_for_change(version, WATCH_POLL_SECONDS)
+    
+    def ImportProfiles(self, request_iterator, context):
+        received = 0
+        imported = 0
+        errors = []
+        failed = 0
+        version = self.store.version
+        
+        print("[ProfileService] Importing profiles...")
+        
+        for batch in request_iterator:
+            valid = []
+            for record in batch.profiles:
+                error = validate_record(record)
+                if error is None:
+                    valid.append((
+                        record.user_id,
+                        record.name,
+                        record.preferred_city,
+                        record.preferred_country.upper()
+                    ))
+                else:
+                    failed += 1
+                    if len(errors) < MAX_REPORTED_IMPORT_ERRORS:
+                        errors.append(profile_pb2.RecordError(
+                            index=received,
+                            user_id=record.user_id,
+                            message=error
+                        ))
+                received += 1
+            
+            if valid:
+                version = self.store.import_batch(valid)
+                imported += len(valid)
+        
+        print(f"[ProfileService] ✅ Imported {imported}/{received} profiles ({failed} failed), now at v{version}")
+        
+        return profile_pb2.ImportProfilesReply(
+            received=received,
+            imported=imported,
+            failed=failed,
+            errors=errors,
+            version=version
+        )
+    
+    def ExportProfiles(self, request, context):
+        batch_size = min(request.batch_size or DEFAULT_EXPORT_BATCH_SIZE, MAX_EXPORT_BATCH_SIZE)
+        records = self.store.export(
+            country=request.country or None,
+            city=request.city or None
+        )
+        
+        print(f"[ProfileService] Exporting {len(records)} profiles in batches of {batch_size}")
+        
+        for start in range(0, len(records), batch_size):
+            if not context.is_active():
+                return
+            yield profile_pb2.ProfileBatch(profiles=[
+                profile_pb2.ProfileRecord(
+                    user_id=record.user_id,
+                    name=record.name,
+                    preferred_city=record.preferred_city,
+                    preferred_country=record.preferred_country,
+                    version=record.version
+                )
+                for record in records[start:start + batch_size]
+            ])
 
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    profile_pb2_grpc.add_ProfileServiceServicer_to_server(ProfileServicer(), server)
-    server.add_insecure_port('[::]:50053')
+    server = create_server('profile')
+    store = ProfileStore(USERS_DB)
+    servicer = ProfileServicer(store)
+    profile_pb2_grpc.add_ProfileServiceServicer_to_server(servicer, server)
+    server.graceful_shutdown.add_drain_hook(servicer.stop_watches)
+    addresses = transport.add_listen_ports(server, 'profile')
     server.start()
-    print("👤 Profile gRPC Server started on port 50053")
+    print(f"👤 Profile gRPC Server started on {', '.join(addresses)}")
     print(f"Available users: {list(USERS_DB.keys())}")
-    print("Press Ctrl+C to stop...")
+    print("Press Ctrl+C or send SIGTERM to stop gracefully...")
     
-    try:
-        server.wait_for_termination()
-    except KeyboardInterrupt:
-        print("\n⏹️  Server stopped.")
-        server.stop(0)
+    server.graceful_shutdown.wait()
 
 
 if __name__ == '__main__':
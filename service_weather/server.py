@@ -1,22 +1,89 @@
 from concurrent import futures
 import grpc
-import requests
 import sys
 import os
+import threading
+import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import weather_pb2
-import weather_pb2_grpc
+from grpc_common import transport
+from grpc_common.scheduler import priority_metadata
+from grpc_common.server import create_server
+from grpc_stubs import weather_pb2, weather_pb2_grpc
+
+# requests, numpy and the profile stubs are imported on first use: a cold
+# start only pays for them once a cache miss or an aggregation needs them
+
+# Seconds a successful wttr.in result is served from cache
+CACHE_TTL_SECONDS = float(os.environ.get('WEATHER_CACHE_TTL', '600'))
+CACHE_MAX_ENTRIES = 10000
+
+# Parallel wttr.in fetches for AggregateWeather cache misses
+AGGREGATE_FETCH_WORKERS = 8
+DEFAULT_PERCENTILES = (50.0, 90.0)
+
+
+def distinct_locations(locations):
+    """Drop repeats of (city, country_code), keyed the way the cache keys them
+
+    A city given without a country code is a repeat of the same city given
+    with one, so it is only kept when no coded entry for that city exists.
+    """
+    coded = {city.lower() for city, country_code in locations if country_code}
+    seen = {}
+    for city, country_code in locations:
+        key = (city.lower(), country_code.upper())
+        if key in seen or (not country_code and key[0] in coded):
+            continue
+        seen[key] = (city, country_code.upper())
+    return list(seen.values())
 
 
 class WeatherServicer(weather_pb2_grpc.WeatherServiceServicer):
+    def __init__(self):
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._fetch_pool = futures.ThreadPoolExecutor(
+            max_workers=AGGREGATE_FETCH_WORKERS,
+            thread_name_prefix="weather-fetch"
+        )
+
+    def close(self):
+        """Stop background fetches and drop cached results"""
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        with self._cache_lock:
+            self._cache.clear()
+
     def GetWeather(self, request, context):
         city = request.city
         country_code = request.country_code or ""
         
         print(f"[WeatherService] Getting weather for: {city}, {country_code}")
         
+        return self._get_weather(city, country_code)
+    
+    def _get_weather(self, city, country_code):
+        """Return a cached WeatherReply if still fresh, otherwise fetch it"""
+        key = (city.lower(), country_code.upper())
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        reply = self._fetch_weather(city, country_code)
+        if reply.success:
+            with self._cache_lock:
+                if key not in self._cache and len(self._cache) >= CACHE_MAX_ENTRIES:
+                    # Evict the oldest insertion
+                    del self._cache[next(iter(self._cache))]
+                self._cache[key] = (now, reply)
+        return reply
+    
+    def _fetch_weather(self, city, country_code):
+        import requests
+        
         try:
             if not city:
                 return weather_pb2.WeatherReply(
@@ -68,21 +135,120 @@ class WeatherServicer(weather_pb2_grpc.WeatherServiceServicer):
                 success=False,
                 error_message=error_msg
             )
+    
+    def AggregateWeather(self, request, context):
+        import numpy as np
+        
+        locations = [(l.city.strip(), l.country_code.upper()) for l in request.locations if l.city.strip()]
+        
+        print(f"[WeatherService] Aggregating weather for {len(locations)} cities"
+              + (f" + users in {request.profile_country}" if request.profile_country else ""))
+        
+        if request.profile_country:
+            try:
+                locations.extend(self._profile_cities(request.profile_country))
+            except grpc.RpcError as e:
+                return weather_pb2.AggregateWeatherReply(
+                    success=False,
+                    error_message=f"Profile query failed: {e.details()}"
+                )
+        
+        # Same city requested twice (or by many users) is aggregated once
+        locations = distinct_locations(locations)
+        percentiles = list(request.percentiles) or list(DEFAULT_PERCENTILES)
+        
+        if not locations:
+            return weather_pb2.AggregateWeatherReply(
+                success=False,
+                error_message="No cities to aggregate"
+            )
+        if any(not 0 <= p <= 100 for p in percentiles):
+            return weather_pb2.AggregateWeatherReply(
+                success=False,
+                error_message="Percentiles must be between 0 and 100"
+            )
+        
+        replies = list(self._fetch_pool.map(lambda location: self._get_weather(*location), locations))
+        available = [reply for reply in replies if reply.success]
+        failed = [city for (city, _), reply in zip(locations, replies) if not reply.success]
+        
+        if not available:
+            return weather_pb2.AggregateWeatherReply(
+                cities_requested=len(locations),
+                failed_cities=failed,
+                success=False,
+                error_message="No weather data available for any requested city"
+            )
+        
+        temps = np.fromiter((r.temperature_celsius for r in available), dtype=np.float64, count=len(available))
+        humidity = np.fromiter((r.humidity for r in available), dtype=np.float64, count=len(available))
+        hottest = int(np.argmax(temps))
+        coldest = int(np.argmin(temps))
+        
+        # Group by country: one pass of bincount / ufunc.at instead of per-group loops
+        countries, group = np.unique([r.country for r in available], return_inverse=True)
+        counts = np.bincount(group)
+        sums = np.bincount(group, weights=temps)
+        mins = np.full(len(countries), np.inf)
+        maxs = np.full(len(countries), -np.inf)
+        np.minimum.at(mins, group, temps)
+        np.maximum.at(maxs, group, temps)
+        
+        print(f"[WeatherService] ✅ Aggregated {len(available)} cities, {len(failed)} failed")
+        
+        return weather_pb2.AggregateWeatherReply(
+            cities_requested=len(locations),
+            cities_processed=len(available),
+            average_temperature=float(temps.mean()),
+            min_temperature=float(temps[coldest]),
+            max_temperature=float(temps[hottest]),
+            hottest_city=available[hottest].city,
+            coldest_city=available[coldest].city,
+            average_humidity=float(humidity.mean()),
+            percentiles=[
+                weather_pb2.TemperaturePercentile(percentile=p, temperature_celsius=float(value))
+                for p, value in zip(percentiles, np.percentile(temps, percentiles))
+            ],
+            countries=[
+                weather_pb2.CountryWeatherStats(
+                    country=str(countries[i]),
+                    cities=int(counts[i]),
+                    average_temperature=float(sums[i] / counts[i]),
+                    min_temperature=float(mins[i]),
+                    max_temperature=float(maxs[i])
+                )
+                for i in range(len(countries))
+            ],
+            failed_cities=failed,
+            success=True,
+            error_message=""
+        )
+    
+    def _profile_cities(self, country):
+        """Distinct (city, country) preferred by users of a country, from ProfileService"""
+        from grpc_stubs import profile_pb2, profile_pb2_grpc
+        
+        with grpc.insecure_channel(transport.target('profile')) as channel:
+            stub = profile_pb2_grpc.ProfileServiceStub(channel)
+            request = profile_pb2.ExportProfilesRequest(country=country)
+            return {
+                (profile.preferred_city.strip(), profile.preferred_country.upper())
+                for batch in stub.ExportProfiles(request, timeout=30, metadata=priority_metadata('batch'))
+                for profile in batch.profiles
+            }
 
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    weather_pb2_grpc.add_WeatherServiceServicer_to_server(WeatherServicer(), server)
-    server.add_insecure_port('[::]:50052')
+    server = create_server('weather')
+    servicer = WeatherServicer()
+    weather_pb2_grpc.add_WeatherServiceServicer_to_server(servicer, server)
+    server.graceful_shutdown.add_exit_hook(servicer.close)
+    addresses = transport.add_listen_ports(server, 'weather')
     server.start()
-    print("🌤️  Weather gRPC Server started on port 50052")
-    print("Press Ctrl+C to stop...")
+    print(f"🌤️  Weather gRPC Server started on {', '.join(addresses)}")
+    print("Press Ctrl+C or send SIGTERM to stop gracefully...")
     
-    try:
-        server.wait_for_termination()
-    except KeyboardInterrupt:
-        print("\n⏹️  Server stopped.")
-        server.stop(0)
+    server.graceful_shutdown.wait()
 
 
 if __name__ == '__main__':
@@ -6,16 +6,17 @@ Fixed encoding issues for Windows PowerShell
 import grpc
 import sys
 import os
+import csv
 import json
 from datetime import datetime
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import all gRPC modules
-import service_pb2, service_pb2_grpc
-import weather_pb2, weather_pb2_grpc
-import profile_pb2, profile_pb2_grpc
-import gateway_pb2, gateway_pb2_grpc
+from grpc_common import transport
+from grpc_common.scheduler import priority_metadata
+
+# gRPC stub modules are imported inside each command so a command only pays
+# for the stubs it actually uses
 
 
 class SimpleOrchestrator:
@@ -23,21 +24,20 @@ class SimpleOrchestrator:
     
     def __init__(self):
         self.services = {
-            'hello': 'localhost:50051',
-            'weather': 'localhost:50052', 
-            'profile': 'localhost:50053',
-            'gateway': 'localhost:50054'
+            name: transport.target(name)
+            for name in ('hello', 'weather', 'profile', 'gateway')
         }
     
-    def get_user_dashboard(self, user_id):
+    def get_user_dashboard(self, user_id, priority='interactive'):
         """Get complete user dashboard from all microservices"""
+        from grpc_stubs import gateway_pb2, gateway_pb2_grpc
         print(f"Connecting ALL microservices for user: {user_id}")
         
         try:
             with grpc.insecure_channel(self.services['gateway']) as channel:
                 stub = gateway_pb2_grpc.GatewayServiceStub(channel)
                 request = gateway_pb2.DashboardRequest(user_id=user_id)
-                response = stub.GetDashboard(request, timeout=20)
+                response = stub.GetDashboard(request, timeout=20, metadata=priority_metadata(priority))
                 
                 if response.success:
                     return {
@@ -71,7 +71,7 @@ class SimpleOrchestrator:
         
         results = []
         for user_id in user_list:
-            result = self.get_user_dashboard(user_id)
+            result = self.get_user_dashboard(user_id, priority='batch')
             if result.get("status") == "SUCCESS":
                 results.append({
                     "user": user_id,
@@ -88,45 +88,170 @@ class SimpleOrchestrator:
             "microservices_used": ["Gateway", "Profile", "Weather", "Hello"]
         }
     
-    def aggregate_weather(self, cities):
-        """Get weather from multiple cities"""
-        print(f"Weather aggregation: {', '.join(cities)}")
-        
-        weather_data = []
-        
-        with grpc.insecure_channel(self.services['weather']) as channel:
-            stub = weather_pb2_grpc.WeatherServiceStub(channel)
-            
-            for city in cities:
-                try:
-                    request = weather_pb2.WeatherRequest(city=city)
-                    response = stub.GetWeather(request, timeout=10)
-                    
-                    if response.success:
-                        weather_data.append({
-                            "city": response.city,
-                            "country": response.country,
-                            "temperature": response.temperature_celsius,
-                            "condition": response.description,
-                            "humidity": response.humidity
-                        })
-                except Exception as e:
-                    weather_data.append({"city": city, "error": str(e)})
-        
-        # Calculate stats
-        temps = [w["temperature"] for w in weather_data if "temperature" in w]
+    def aggregate_weather(self, cities, profile_country=""):
+        """Get weather statistics for multiple cities, computed by the Weather service"""
+        from grpc_stubs import weather_pb2, weather_pb2_grpc
+        print(f"Weather aggregation: {', '.join(cities) or 'users in ' + profile_country}")
+        
+        try:
+            with grpc.insecure_channel(self.services['weather']) as channel:
+                stub = weather_pb2_grpc.WeatherServiceStub(channel)
+                request = weather_pb2.AggregateWeatherRequest(
+                    locations=[weather_pb2.WeatherRequest(city=city) for city in cities],
+                    profile_country=profile_country
+                )
+                response = stub.AggregateWeather(request, timeout=30, metadata=priority_metadata('batch'))
+        except Exception as e:
+            return {"status": "CONNECTION_FAILED", "error": str(e)}
+        
+        if not response.success:
+            return {"status": "FAILED", "error": response.error_message,
+                    "failed_cities": list(response.failed_cities)}
         
         return {
             "status": "WEATHER_SUCCESS",
-            "cities_data": weather_data,
             "statistics": {
-                "cities_processed": len(weather_data),
-                "average_temperature": round(sum(temps) / len(temps), 1) if temps else 0,
-                "hottest_city": max(weather_data, key=lambda x: x.get("temperature", -999))["city"] if temps else None,
-                "coldest_city": min(weather_data, key=lambda x: x.get("temperature", 999))["city"] if temps else None
-            }
+                "cities_processed": response.cities_processed,
+                "average_temperature": round(response.average_temperature, 1),
+                "hottest_city": response.hottest_city,
+                "coldest_city": response.coldest_city,
+                "temperature_percentiles": {
+                    f"p{p.percentile:g}": round(p.temperature_celsius, 1) for p in response.percentiles
+                },
+                "by_country": {
+                    c.country: {
+                        "cities": c.cities,
+                        "average_temperature": round(c.average_temperature, 1),
+                        "min_temperature": c.min_temperature,
+                        "max_temperature": c.max_temperature
+                    }
+                    for c in response.countries
+                }
+            },
+            "failed_cities": list(response.failed_cities)
         }
 
+    def get_metrics(self, service, prefix=""):
+        """Get scheduler and queue-time metrics from a service's AdminService"""
+        from grpc_stubs import admin_pb2, admin_pb2_grpc
+        try:
+            with grpc.insecure_channel(self.services[service]) as channel:
+                stub = admin_pb2_grpc.AdminServiceStub(channel)
+                response = stub.GetMetrics(admin_pb2.MetricsRequest(prefix=prefix), timeout=5)
+                return {
+                    "status": "SUCCESS",
+                    "service": response.service,
+                    "protobuf_backend": response.protobuf_backend,
+                    "metrics": dict(sorted(response.metrics.items()))
+                }
+        except Exception as e:
+            return {"status": "CONNECTION_FAILED", "error": str(e)}
+
+    def manage_faults(self, service, action="list", rules_json=""):
+        """List, add, set (replace) or clear a service's fault-injection rules
+
+        `rules_json` is one FaultRule or a list of them as JSON, e.g.
+        '{"method": "/weather.WeatherService/*", "percentage": 20, "error_code": 14}'
+        """
+        from google.protobuf import json_format
+        from grpc_stubs import admin_pb2, admin_pb2_grpc
+        try:
+            with grpc.insecure_channel(self.services[service]) as channel:
+                stub = admin_pb2_grpc.AdminServiceStub(channel)
+                if action in ("add", "set"):
+                    rules = json.loads(rules_json)
+                    request = json_format.ParseDict(
+                        {"rules": rules if isinstance(rules, list) else [rules], "replace": action == "set"},
+                        admin_pb2.SetFaultsRequest()
+                    )
+                    response = stub.SetFaults(request, timeout=5)
+                elif action == "clear":
+                    response = stub.ClearFaults(admin_pb2.ClearFaultsRequest(), timeout=5)
+                else:
+                    response = stub.ListFaults(admin_pb2.ListFaultsRequest(), timeout=5)
+                return {
+                    "status": "SUCCESS",
+                    "service": service,
+                    "rules": [
+                        json_format.MessageToDict(rule, preserving_proto_field_name=True)
+                        for rule in response.rules
+                    ]
+                }
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+                return {"status": "FAILED", "error": e.details()}
+            return {"status": "CONNECTION_FAILED", "error": str(e)}
+        except (ValueError, json_format.ParseError) as e:
+            return {"status": "FAILED", "error": f"Invalid fault rules: {e}"}
+
+    def check_health(self, service):
+        """Query a service's standard grpc.health.v1 status"""
+        from grpc_health.v1 import health_pb2, health_pb2_grpc
+        try:
+            with grpc.insecure_channel(self.services[service]) as channel:
+                stub = health_pb2_grpc.HealthStub(channel)
+                response = stub.Check(health_pb2.HealthCheckRequest(), timeout=5)
+                return {
+                    "status": "SUCCESS",
+                    "service": service,
+                    "health": health_pb2.HealthCheckResponse.ServingStatus.Name(response.status)
+                }
+        except Exception as e:
+            return {"status": "CONNECTION_FAILED", "error": str(e)}
+
+    def import_profiles(self, csv_path, batch_size=1000):
+        """Stream profiles from a CSV file (user_id,name,city,country) into the Profile service"""
+        from grpc_stubs import profile_pb2, profile_pb2_grpc
+        print(f"Importing profiles from: {csv_path}")
+        
+        def batches():
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                batch = []
+                for row in csv.reader(f):
+                    if not row or row[0] == "user_id":
+                        continue
+                    row = (row + [""] * 4)[:4]
+                    batch.append(profile_pb2.ProfileRecord(
+                        user_id=row[0], name=row[1], preferred_city=row[2], preferred_country=row[3]
+                    ))
+                    if len(batch) == batch_size:
+                        yield profile_pb2.ProfileBatch(profiles=batch)
+                        batch = []
+                if batch:
+                    yield profile_pb2.ProfileBatch(profiles=batch)
+        
+        try:
+            with grpc.insecure_channel(self.services['profile']) as channel:
+                stub = profile_pb2_grpc.ProfileServiceStub(channel)
+                response = stub.ImportProfiles(batches(), metadata=priority_metadata('batch'))
+                return {
+                    "status": "IMPORT_SUCCESS" if not response.failed else "IMPORT_PARTIAL",
+                    "received": response.received,
+                    "imported": response.imported,
+                    "failed": response.failed,
+                    "errors": [
+                        {"row": e.index, "user_id": e.user_id, "error": e.message}
+                        for e in response.errors
+                    ],
+                    "store_version": response.version
+                }
+        except Exception as e:
+            return {"status": "CONNECTION_FAILED", "error": str(e)}
+
+    def export_profiles(self, country="", out=sys.stdout):
+        """Write profiles (optionally for one country) as CSV"""
+        from grpc_stubs import profile_pb2, profile_pb2_grpc
+        with grpc.insecure_channel(self.services['profile']) as channel:
+            stub = profile_pb2_grpc.ProfileServiceStub(channel)
+            request = profile_pb2.ExportProfilesRequest(country=country)
+            writer = csv.writer(out)
+            writer.writerow(["user_id", "name", "city", "country", "version"])
+            for batch in stub.ExportProfiles(request, metadata=priority_metadata('batch')):
+                writer.writerows(
+                    (p.user_id, p.name, p.preferred_city, p.preferred_country, p.version)
+                    for p in batch.profiles
+                )
+
 
 def main():
     if len(sys.argv) < 2:
@@ -134,6 +259,12 @@ def main():
         print("  python simple_orchestrator.py dashboard <user_id>")
         print("  python simple_orchestrator.py compare <user1> <user2> [user3...]")
         print("  python simple_orchestrator.py weather <city1> <city2> [city3...]")
+        print("  python simple_orchestrator.py weather-users <country_code>")
+        print("  python simple_orchestrator.py metrics <hello|weather|profile|gateway> [prefix]")
+        print("  python simple_orchestrator.py health <hello|weather|profile|gateway>")
+        print("  python simple_orchestrator.py faults <service> [list|clear|add <json>|set <json>]")
+        print("  python simple_orchestrator.py import-profiles <file.csv>")
+        print("  python simple_orchestrator.py export-profiles [country]")
         return
     
     orchestrator = SimpleOrchestrator()
@@ -163,6 +294,53 @@ def main():
         result = orchestrator.aggregate_weather(cities)
         print(json.dumps(result, indent=2))
         
+    elif command == "weather-users":
+        if len(sys.argv) < 3:
+            print("Error: Please provide a country code")
+            return
+        result = orchestrator.aggregate_weather([], profile_country=sys.argv[2])
+        print(json.dumps(result, indent=2))
+        
+    elif command == "metrics":
+        if len(sys.argv) < 3 or sys.argv[2] not in orchestrator.services:
+            print(f"Error: Please provide one of: {', '.join(orchestrator.services)}")
+            return
+        prefix = sys.argv[3] if len(sys.argv) > 3 else ""
+        result = orchestrator.get_metrics(sys.argv[2], prefix)
+        print(json.dumps(result, indent=2))
+        
+    elif command == "health":
+        if len(sys.argv) < 3 or sys.argv[2] not in orchestrator.services:
+            print(f"Error: Please provide one of: {', '.join(orchestrator.services)}")
+            return
+        result = orchestrator.check_health(sys.argv[2])
+        print(json.dumps(result, indent=2))
+        
+    elif command == "faults":
+        if len(sys.argv) < 3 or sys.argv[2] not in orchestrator.services:
+            print(f"Error: Please provide one of: {', '.join(orchestrator.services)}")
+            return
+        action = sys.argv[3] if len(sys.argv) > 3 else "list"
+        if action in ("add", "set") and len(sys.argv) < 5:
+            print("Error: Please provide fault rules as JSON")
+            return
+        result = orchestrator.manage_faults(sys.argv[2], action, sys.argv[4] if len(sys.argv) > 4 else "")
+        print(json.dumps(result, indent=2))
+        
+    elif command == "import-profiles":
+        if len(sys.argv) < 3:
+            print("Error: Please provide a CSV file (user_id,name,city,country)")
+            return
+        result = orchestrator.import_profiles(sys.argv[2])
+        print(json.dumps(result, indent=2))
+        
+    elif command == "export-profiles":
+        country = sys.argv[2] if len(sys.argv) > 2 else ""
+        try:
+            orchestrator.export_profiles(country)
+        except grpc.RpcError as e:
+            print(f"Error: {e.details()}")
+        
     else:
         print(f"Unknown command: {command}")
 
@@ -8,21 +8,18 @@ import os
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-import service_pb2
-import service_pb2_grpc
-import weather_pb2
-import weather_pb2_grpc
-import profile_pb2
-import profile_pb2_grpc
-import gateway_pb2
-import gateway_pb2_grpc
+from grpc_common import transport
+from grpc_stubs import service_pb2, service_pb2_grpc
+from grpc_stubs import weather_pb2, weather_pb2_grpc
+from grpc_stubs import profile_pb2, profile_pb2_grpc
+from grpc_stubs import gateway_pb2, gateway_pb2_grpc
 
 
 def test_hello_service(name="puneeth"):
     """Test Hello Service via gRPC"""
     print(f"\n🔹 Testing Hello Service: {name}")
     try:
-        with grpc.insecure_channel('localhost:50051') as channel:
+        with grpc.insecure_channel(transport.target('hello')) as channel:
             stub = service_pb2_grpc.HelloServiceStub(channel)
             request = service_pb2.HelloRequest(name=name)
             response = stub.SayHello(request, timeout=5)
@@ -35,7 +32,7 @@ def test_weather_service(city="London", country=""):
     """Test Weather Service via gRPC"""
     print(f"\n🔹 Testing Weather Service: {city}")
     try:
-        with grpc.insecure_channel('localhost:50052') as channel:
+        with grpc.insecure_channel(transport.target('weather')) as channel:
             stub = weather_pb2_grpc.WeatherServiceStub(channel)
             request = weather_pb2.WeatherRequest(city=city, country_code=country)
             response = stub.GetWeather(request, timeout=15)
@@ -56,7 +53,7 @@ def test_profile_service(user_id="puneeth"):
     """Test Profile Service via gRPC"""
     print(f"\n🔹 Testing Profile Service: {user_id}")
     try:
-        with grpc.insecure_channel('localhost:50053') as channel:
+        with grpc.insecure_channel(transport.target('profile')) as channel:
             stub = profile_pb2_grpc.ProfileServiceStub(channel)
             request = profile_pb2.ProfileRequest(user_id=user_id)
             response = stub.GetProfile(request, timeout=5)
@@ -66,6 +63,7 @@ def test_profile_service(user_id="puneeth"):
                 print(f"   👤 Name: {response.name}")
                 print(f"   🏙️  Preferred City: {response.preferred_city}")
                 print(f"   🌍 Country: {response.preferred_country}")
+                print(f"   🔢 Version: {response.version}")
             else:
                 print(f"❌ Error: {response.error_message}")
     except Exception as e:
@@ -76,7 +74,7 @@ def test_gateway_dashboard(user_id="puneeth"):
     """Test Gateway Dashboard via gRPC"""
     print(f"\n🔹 Testing Gateway Dashboard: {user_id}")
     try:
-        with grpc.insecure_channel('localhost:50054') as channel:
+        with grpc.insecure_channel(transport.target('gateway')) as channel:
             stub = gateway_pb2_grpc.GatewayServiceStub(channel)
             request = gateway_pb2.DashboardRequest(user_id=user_id)
             response = stub.GetDashboard(request, timeout=20)
@@ -97,7 +95,7 @@ def test_gateway_user_weather(user_id="puneeth"):
     """Test Gateway User Weather via gRPC"""
     print(f"\n🔹 Testing Gateway User Weather: {user_id}")
     try:
-        with grpc.insecure_channel('localhost:50054') as channel:
+        with grpc.insecure_channel(transport.target('gateway')) as channel:
             stub = gateway_pb2_grpc.GatewayServiceStub(channel)
             request = gateway_pb2.UserWeatherRequest(user_id=user_id)
             response = stub.GetUserWeather(request, timeout=20)